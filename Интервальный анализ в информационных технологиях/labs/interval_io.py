@@ -0,0 +1,121 @@
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+# Формат .ivl: сигнатура, длина заголовка (uint32 LE), JSON-заголовок, выровненный
+# пробелами до ALIGN байт, затем сырые float64 (little-endian, C-порядок).
+# Последняя ось данных всегда имеет длину 2: (нижняя, верхняя) или (середина, радиус).
+MAGIC = b'IVL1'
+ALIGN = 64
+REPRESENTATIONS = ('endpoints', 'midrad')
+ROUNDING_MODES = ('nearest', 'outward')
+META_KEY = '__meta__'
+
+
+def _check_meta(representation: str, rounding: str) -> None:
+    if representation not in REPRESENTATIONS:
+        raise ValueError(f'Неизвестное представление интервалов: {representation}')
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f'Неизвестный режим округления: {rounding}')
+
+
+def _as_interval_array(data: np.ndarray) -> np.ndarray:
+    data = np.ascontiguousarray(data, dtype='<f8')
+    if data.ndim == 0 or data.shape[-1] != 2:
+        raise ValueError(f'Ожидался массив формы (..., 2), получено {data.shape}')
+    return data
+
+
+def save_intervals(
+    path: str | Path,
+    data: np.ndarray,
+    representation: str = 'endpoints',
+    rounding: str = 'nearest',
+) -> None:
+    """Запись интервального массива формы (..., 2) в бинарный файл .ivl"""
+    _check_meta(representation, rounding)
+    data = _as_interval_array(data)
+    header = json.dumps(
+        {
+            'shape': list(data.shape),
+            'dtype': '<f8',
+            'representation': representation,
+            'rounding': rounding,
+        }
+    ).encode('ascii')
+    prefix = len(MAGIC) + 4
+    header += b' ' * (-(prefix + len(header)) % ALIGN)
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        data.tofile(f)
+
+
+def read_header(path: str | Path) -> dict:
+    """Чтение заголовка файла .ivl; в поле offset — смещение начала данных"""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path}: не является файлом интервального массива')
+        (length,) = struct.unpack('<I', f.read(4))
+        header = json.loads(f.read(length))
+    header['offset'] = len(MAGIC) + 4 + length
+    header['shape'] = tuple(header['shape'])
+    return header
+
+
+def load_intervals(path: str | Path, mmap_mode: str | None = 'r') -> tuple[np.ndarray, dict]:
+    """Чтение файла .ivl; по умолчанию данные отображаются в память без копирования"""
+    header = read_header(path)
+    shape, offset = header['shape'], header['offset']
+    if mmap_mode is None:
+        count = int(np.prod(shape))
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = np.fromfile(f, dtype=header['dtype'], count=count).reshape(shape)
+    else:
+        data = np.memmap(path, dtype=header['dtype'], mode=mmap_mode, offset=offset, shape=shape)
+    return data, header
+
+
+def save_results(
+    path: str | Path,
+    representation: str = 'endpoints',
+    rounding: str = 'nearest',
+    **arrays: np.ndarray,
+) -> None:
+    """Запись нескольких интервальных массивов (результатов решателя) в один .npz"""
+    _check_meta(representation, rounding)
+    meta = json.dumps({'representation': representation, 'rounding': rounding})
+    np.savez(path, **{name: _as_interval_array(a) for name, a in arrays.items()}, **{META_KEY: np.array(meta)})
+
+
+def load_results(path: str | Path) -> tuple[dict[str, np.ndarray], dict]:
+    """Чтение результатов, записанных save_results"""
+    with np.load(path) as npz:
+        arrays = {name: npz[name] for name in npz.files if name != META_KEY}
+        meta = json.loads(str(npz[META_KEY]))
+    return arrays, meta
+
+
+def to_endpoints(data: np.ndarray, representation: str = 'midrad', rounding: str = 'nearest') -> np.ndarray:
+    """Перевод массива в представление (нижняя, верхняя) граница"""
+    _check_meta(representation, rounding)
+    if representation == 'endpoints':
+        return np.asarray(data)
+    mid, rad = data[..., 0], data[..., 1]
+    lower, upper = mid - rad, mid + rad
+    if rounding == 'outward':
+        # Сложение выше округлялось к ближайшему, поэтому расширяем границы на ulp
+        lower = np.nextafter(lower, -np.inf)
+        upper = np.nextafter(upper, np.inf)
+    return np.stack((lower, upper), axis=-1)
+
+
+def to_midrad(data: np.ndarray) -> np.ndarray:
+    """Перевод массива из представления границами в (середина, радиус)"""
+    lower, upper = data[..., 0], data[..., 1]
+    return np.stack(((lower + upper) / 2, (upper - lower) / 2), axis=-1)
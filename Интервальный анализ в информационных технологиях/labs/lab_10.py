@@ -2,6 +2,9 @@ import math
 from typing import List
 import sys
 
+import numpy as np
+from interval_io import save_results
+
 
 class Interval:
     def __init__(self, lower: float = 0, upper: float = 0):
@@ -172,85 +175,103 @@ def compute_width(x: List[Interval]) -> List[float]:
     return [elem.width for elem in x]
 
 
-def main():
+def to_array(v: List[Interval]) -> np.ndarray:
+    """Интервальный вектор -> массив формы (N, 2)"""
+    return np.array([[elem.lower, elem.upper] for elem in v])
+
+
+def main(write_text: bool = True):
     N = 6
     V = 11
     Rad = 0.0001
 
+    # Инициализация матрицы A и вектора b
+    A = [[Interval(0, 0) for _ in range(N)] for _ in range(N)]
+    b = [Interval(0, 0) for _ in range(N)]
+
+    for i in range(N):
+        for j in range(N):
+            if i == j:
+                mid = abs(99 + math.sin(i + 1) / V)
+                A[i][j] = Interval(mid - Rad, mid + Rad)
+            else:
+                mid = -abs(0.01 * V + math.sin(i - j))
+                A[i][j] = Interval(mid - Rad, mid + Rad)
+
+    for j in range(N):
+        mid = 2 * math.cos(j + 1 + V)
+        b[j] = Interval(mid - Rad, mid + Rad)
+
+    # Сохраняем копии исходных данных
+    A_orig = [[Interval(A[i][j].lower, A[i][j].upper) for j in range(N)] for i in range(N)]
+    b_orig = [Interval(b[i].lower, b[i].upper) for i in range(N)]
+
+    # QR разложение методом Хаусхолдера
+    householder_qr(A, b, N)
+
+    # Решение системы
+    x = back_substitution(A, b)
+    widths = compute_width(x)
+    residual = compute_residual(A_orig, b_orig, x)
+
     try:
-        with open("result_python.txt", "w", encoding="utf-8") as out_file:
-            # Инициализация матрицы A и вектора b
-            A = [[Interval(0, 0) for _ in range(N)] for _ in range(N)]
-            b = [Interval(0, 0) for _ in range(N)]
-
-            out_file.write("Интервальная матрица A:\n")
-            for i in range(N):
-                for j in range(N):
-                    if i == j:
-                        mid = abs(99 + math.sin(i + 1) / V)
-                        A[i][j] = Interval(mid - Rad, mid + Rad)
-                    else:
-                        mid = -abs(0.01 * V + math.sin(i - j))
-                        A[i][j] = Interval(mid - Rad, mid + Rad)
-
-            # Форматированный вывод матрицы A
-            for row in A:
-                for elem in row:
+        # Бинарная копия результатов без потери точности
+        save_results(
+            'result_python.npz',
+            A=np.array([to_array(row) for row in A_orig]),
+            b=to_array(b_orig),
+            R=np.array([to_array(row) for row in A]),
+            y=to_array(b),
+            x=to_array(x),
+            residual=to_array(residual),
+        )
+
+        # Текстовый отчёт — необязательное представление поверх бинарного файла
+        if write_text:
+            with open("result_python.txt", "w", encoding="utf-8") as out_file:
+                # Форматированный вывод матрицы A
+                out_file.write("Интервальная матрица A:\n")
+                for row in A_orig:
+                    for elem in row:
+                        out_file.write(f"[{elem.lower:8.4f}, {elem.upper:8.4f}] ")
+                    out_file.write("\n")
+                out_file.write("\n")
+
+                # Форматированный вывод вектора b
+                out_file.write("Интервальный вектор b:\n")
+                for elem in b_orig:
                     out_file.write(f"[{elem.lower:8.4f}, {elem.upper:8.4f}] ")
+                out_file.write("\n\n")
+
+                out_file.write("Интервальная треугольная матрица:\n")
+                for row in A:
+                    for elem in row:
+                        out_file.write(f"[{elem.lower:8.4f}, {elem.upper:8.4f}] ")
+                    out_file.write("\n")
                 out_file.write("\n")
-            out_file.write("\n")
 
-            out_file.write("Интервальный вектор b:\n")
-            for j in range(N):
-                mid = 2 * math.cos(j + 1 + V)
-                b[j] = Interval(mid - Rad, mid + Rad)
+                out_file.write("Преобразованный вектор b:\n")
+                for elem in b:
+                    out_file.write(f"[{elem.lower:8.4f}, {elem.upper:8.4f}]\n")
+                out_file.write("\n")
 
-            # Форматированный вывод вектора b
-            for elem in b:
-                out_file.write(f"[{elem.lower:8.4f}, {elem.upper:8.4f}] ")
-            out_file.write("\n\n")
+                out_file.write("Интервальный вектор X:\n")
+                for elem in x:
+                    out_file.write(f"[{elem.lower:10.6f}, {elem.upper:10.6f}] ")
+                out_file.write("\n\n")
 
-            # Сохраняем копии исходных данных
-            A_orig = [[Interval(A[i][j].lower, A[i][j].upper) for j in range(N)] for i in range(N)]
-            b_orig = [Interval(b[i].lower, b[i].upper) for i in range(N)]
+                # Ширина вектора X
+                out_file.write("Ширина вектора wid(X):\n")
+                for w in widths:
+                    out_file.write(f"{w:10.6f}")
+                out_file.write("\n\n")
 
-            # QR разложение методом Хаусхолдера
-            householder_qr(A, b, N)
+                # Вектор невязки
+                out_file.write("Вектор невязки:\n")
+                for elem in residual:
+                    out_file.write(f"[{elem.lower:10.6f}, {elem.upper:10.6f}]\n")
 
-            out_file.write("Интервальная треугольная матрица:\n")
-            for row in A:
-                for elem in row:
-                    out_file.write(f"[{elem.lower:8.4f}, {elem.upper:8.4f}] ")
-                out_file.write("\n")
-            out_file.write("\n")
-
-            out_file.write("Преобразованный вектор b:\n")
-            for elem in b:
-                out_file.write(f"[{elem.lower:8.4f}, {elem.upper:8.4f}]\n")
-            out_file.write("\n")
-
-            # Решение системы
-            x = back_substitution(A, b)
-
-            out_file.write("Интервальный вектор X:\n")
-            for elem in x:
-                out_file.write(f"[{elem.lower:10.6f}, {elem.upper:10.6f}] ")
-            out_file.write("\n\n")
-
-            # Ширина вектора X
-            widths = compute_width(x)
-            out_file.write("Ширина вектора wid(X):\n")
-            for w in widths:
-                out_file.write(f"{w:10.6f}")
-            out_file.write("\n\n")
-
-            # Вектор невязки
-            residual = compute_residual(A_orig, b_orig, x)
-            out_file.write("Вектор невязки:\n")
-            for elem in residual:
-                out_file.write(f"[{elem.lower:10.6f}, {elem.upper:10.6f}]\n")
-
-            print("Результаты записаны в файл result_python.txt")
+        print('Результаты записаны в файлы result_python.npz' + (' и result_python.txt' if write_text else ''))
 
     except IOError as e:
         print(f"Не удалось открыть файл для записи: {e}")
@@ -1,5 +1,8 @@
 import math
 
+import numpy as np
+from interval_io import save_results
+
 
 # Класс интервала
 class Interval:
@@ -31,10 +34,18 @@ class Interval:
         p4 = self.right / other.right
         return Interval(min(p1, p2, p3, p4), max(p1, p2, p3, p4))
 
+
+# Интервальный вектор -> массив формы (N, 2)
+def to_array(intervals: list[Interval]) -> np.ndarray:
+    return np.array([[iv.left, iv.right] for iv in intervals])
+
+
 # Параметры
 N = 5
 V = 11.0
 rad = 0.01
+# Текстовый отчёт — необязательное представление поверх бинарного result.npz
+WRITE_TEXT = True
 
 # Формирование матрицы и вектора
 A = [[None]*N for _ in range(N)]
@@ -79,23 +90,34 @@ for i in range(N):
         sum_ = sum_ + A[i][j] * x[j]
     r[i] = sum_ - b[i]
 
-# Сохраняем результаты в файл
-with open("result.txt", "w") as f:
-    # Интервальная матрица A и вектор b (:7:3)
-    f.write("Интервальная матрица A и вектор b:\n")
-    for i in range(N):
-        f.write(" ".join(f"[{A[i][j].left:7.3f},{A[i][j].right:7.3f}]" for j in range(N)))
-        f.write(" | " + f"[{b[i].left:7.3f},{b[i].right:7.3f}]\n")
-
-    # Интервальная треугольная матрица (:7:3)
-    f.write("\nИнтервальная треугольная матрица и вектор:\n")
-    for i in range(N):
-        f.write(" ".join(f"[{Ab[i][j].left:7.3f},{Ab[i][j].right:7.3f}]" for j in range(N)))
-        f.write(" | " + f"[{Ab[i][N].left:7.3f},{Ab[i][N].right:7.3f}]\n")
-
-    # Интервальный вектор X и вектор невязки (:10:6)
-    f.write("\nИнтервальный вектор X и вектор невязки:\n")
-    for i in range(N):
-        f.write(f"[{x[i].left:10.6f},{x[i].right:10.6f}] | [{r[i].left:10.6f},{r[i].right:10.6f}]\n")
-
-print("Результаты сохранены в файл result.txt")
+# Сохраняем результаты в бинарный файл без потери точности
+save_results(
+    'result.npz',
+    A=np.array([to_array(row) for row in A]),
+    b=to_array(b),
+    Ab=np.array([to_array(row) for row in Ab]),
+    x=to_array(x),
+    r=to_array(r),
+)
+
+# Сохраняем результаты в текстовый файл
+if WRITE_TEXT:
+    with open("result.txt", "w") as f:
+        # Интервальная матрица A и вектор b (:7:3)
+        f.write("Интервальная матрица A и вектор b:\n")
+        for i in range(N):
+            f.write(" ".join(f"[{A[i][j].left:7.3f},{A[i][j].right:7.3f}]" for j in range(N)))
+            f.write(" | " + f"[{b[i].left:7.3f},{b[i].right:7.3f}]\n")
+
+        # Интервальная треугольная матрица (:7:3)
+        f.write("\nИнтервальная треугольная матрица и вектор:\n")
+        for i in range(N):
+            f.write(" ".join(f"[{Ab[i][j].left:7.3f},{Ab[i][j].right:7.3f}]" for j in range(N)))
+            f.write(" | " + f"[{Ab[i][N].left:7.3f},{Ab[i][N].right:7.3f}]\n")
+
+        # Интервальный вектор X и вектор невязки (:10:6)
+        f.write("\nИнтервальный вектор X и вектор невязки:\n")
+        for i in range(N):
+            f.write(f"[{x[i].left:10.6f},{x[i].right:10.6f}] | [{r[i].left:10.6f},{r[i].right:10.6f}]\n")
+
+print('Результаты сохранены в файлы result.npz' + (' и result.txt' if WRITE_TEXT else ''))
@@ -1,6 +1,9 @@
 import math
 from typing import List, Tuple
 
+import numpy as np
+from interval_io import save_results
+
 
 class Interval:
     def __init__(self, l: float, r: float):
@@ -15,6 +18,10 @@ class Interval:
         return self.r - self.l
 
 
+def to_array(intervals: List[Interval]) -> np.ndarray:
+    return np.array([[iv.l, iv.r] for iv in intervals])
+
+
 def interval_str_4(iv: Interval) -> str:
     return f"[{iv.l:7.4f},{iv.r:7.4f}]"
 
@@ -107,7 +114,7 @@ def givens_qr_solve(A: List[List[Interval]], b: List[Interval]) -> Tuple[
     return R, y, X, res
 
 
-def main():
+def main(write_text: bool = True):
     N = 5
     V = 11
     rad = 0.0001
@@ -130,7 +137,21 @@ def main():
     # Решение системы
     R, y, X, res = givens_qr_solve(A, b)
 
-    # Вывод результатов
+    # Бинарная копия результатов без потери точности
+    save_results(
+        'interval_output_python.npz',
+        A=np.array([to_array(row) for row in A]),
+        b=to_array(b),
+        R=np.array([to_array(row) for row in R]),
+        y=to_array(y),
+        X=to_array(X),
+        res=to_array(res),
+    )
+
+    # Текстовый отчёт — необязательное представление поверх бинарного файла
+    if not write_text:
+        return
+
     with open("interval_output_python.txt", "w", encoding="utf-8") as fout:
         def output(s):
             print(s, end="")
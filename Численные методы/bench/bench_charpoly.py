@@ -0,0 +1,51 @@
+import numpy as np
+from common import best_time, print_row
+
+from hessenberg import hessenberg, hyman_charpoly_value, la_budde_charpoly
+from lab_4 import danilevski_strict, leverrier_charpoly
+from polynomial import Polynomial
+
+SIZES = [4, 10, 25, 50, 100, 200, 300]
+LEVERRIER_MAX_N = 200
+# Точки проверки коэффициентов Ла Будде независимым вычислением det(λI - H) по Хайману
+CHECK_POINTS = np.linspace(-1.5, 1.5, 7)
+
+
+def test_matrix(n, seed=0):
+    """A = Q diag(λ) Q^T с известными λ из [-1, 1] и точные коэффициенты prod (x - λ_i)"""
+    rng = np.random.default_rng(seed)
+    lam = rng.uniform(-1.0, 1.0, n)
+    Q = np.linalg.qr(rng.standard_normal((n, n)))[0]
+    return (Q * lam) @ Q.T, np.poly(lam)
+
+
+def rel_error(coeffs, exact):
+    return float(np.abs(np.asarray(coeffs) - exact).max() / np.abs(exact).max())
+
+
+def hyman_check(H, coeffs):
+    """Расхождение значений многочлена с коэффициентами coeffs и det(λI - H) по Хайману
+    в точках CHECK_POINTS, относительно sum |c_k| |λ|^k (масштаба ошибки округления)"""
+    poly = Polynomial.from_desc(coeffs)
+    scale = Polynomial(np.abs(poly.coeffs))(np.abs(CHECK_POINTS))
+    return float(np.max(np.abs(poly(CHECK_POINTS) - hyman_charpoly_value(H, CHECK_POINTS)) / scale))
+
+
+def main():
+    print_row("n", "hessenberg, s", "error", "hyman check", "danilevsky, s", "error", "leverrier, s", "error")
+    for n in SIZES:
+        A, exact = test_matrix(n)
+        H = hessenberg(A)
+        t_h, c_h = best_time(lambda: la_budde_charpoly(hessenberg(A)), repeat=1)
+        t_d, (_, c_d) = best_time(danilevski_strict, A.tolist(), repeat=1)
+        row = [n, t_h, rel_error(c_h, exact), hyman_check(H, c_h), t_d, rel_error(c_d, exact)]
+        if n <= LEVERRIER_MAX_N:
+            t_l, c_l = best_time(leverrier_charpoly, A.tolist(), repeat=1)
+            row += [t_l, rel_error(c_l, exact)]
+        else:
+            row += ["-", "-"]
+        print_row(*row)
+
+
+if __name__ == "__main__":
+    main()
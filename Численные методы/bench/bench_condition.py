@@ -0,0 +1,26 @@
+import numpy as np
+from common import best_time, print_row
+
+from lab_2 import condition_number
+from lu import LUFactorization
+
+SIZES = [50, 100, 500, 1000, 2000, 5000]
+EXACT_MAX_N = 2000
+
+
+def main():
+    print_row("n", "LU, s", "estimate, s", "exact, s", "est/exact")
+    rng = np.random.default_rng(0)
+    for n in SIZES:
+        A = rng.standard_normal((n, n))
+        t_lu, lu = best_time(LUFactorization, A, repeat=1)
+        t_est, estimate = best_time(condition_number, A, lu, "estimate", repeat=1)
+        if n <= EXACT_MAX_N:
+            t_exact, exact = best_time(condition_number, A, lu, "exact", repeat=1)
+            print_row(n, t_lu, t_est, t_exact, estimate / exact)
+        else:
+            print_row(n, t_lu, t_est, "-", "-")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import numpy as np
+from common import best_time, print_row
+
+from lab_4 import eigen_pairs
+
+SIZES = [4, 10, 25, 50, 100, 250, 500, 1000]
+# Путь через характеристический многочлен теряет корни уже при n порядка десятков
+DANILEVSKY_MAX_N = 25
+
+
+def residual(A, w, V):
+    V = np.array(V).T
+    return float(np.abs(A @ V - V * np.array(w)).max()) if len(w) else float("nan")
+
+
+def structured_matrices():
+    """Матрицы с нулями на поддиагонали и кратными значениями — на них ошибается неточный счёт Штурма"""
+    block = np.array([[2.0, 1.0], [1.0, 2.0]])
+    split = np.array([[2.0, 1.0, 0.0], [1.0, 2.0, 0.0], [0.0, 0.0, 2.0]])
+    return {
+        "kron(I3, [[2,1],[1,2]])": np.kron(np.eye(3), block),
+        "split 3x3": split,
+        "kron(I20, ones(3))": np.kron(np.eye(20), np.ones((3, 3))),
+        "diag(1..8)": np.diag(np.arange(1.0, 9.0)),
+        "zeros(4)": np.zeros((4, 4)),
+    }
+
+
+def check_structured():
+    """Сравнение с numpy.linalg.eigvalsh: ошибка значений, невязка и ортогональность векторов"""
+    print_row("matrix", "eigenvalues", "residual", "orthogonality", width=26)
+    failed = False
+    for name, A in structured_matrices().items():
+        w, V = eigen_pairs(A, "symmetric")
+        Q = np.array(V).T
+        errors = (
+            float(np.abs(np.array(w) - np.linalg.eigvalsh(A)).max()),
+            residual(A, w, V),
+            float(np.abs(Q.T @ Q - np.eye(len(w))).max()),
+        )
+        failed |= max(errors) > 1e-12
+        print_row(name, *errors, width=26)
+    if failed:
+        raise SystemExit("eigh расходится с numpy.linalg.eigvalsh")
+
+
+def main():
+    check_structured()
+
+    print_row("n", "danilevsky, s", "found", "symmetric, s", "residual", "numpy, s")
+    rng = np.random.default_rng(0)
+    for n in SIZES:
+        M = rng.standard_normal((n, n))
+        A = M + M.T
+        t_sym, (w, V) = best_time(eigen_pairs, A, "symmetric", repeat=1)
+        t_np, _ = best_time(np.linalg.eigh, A, repeat=1)
+        if n <= DANILEVSKY_MAX_N:
+            t_dan, (roots, _) = best_time(eigen_pairs, A.tolist(), "danilevsky", repeat=1)
+            print_row(n, t_dan, f"{len(roots)}/{n}", t_sym, residual(A, w, V), t_np)
+        else:
+            print_row(n, "-", "-", t_sym, residual(A, w, V), t_np)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import os
+import tracemalloc
+
+import numpy as np
+from common import best_time, print_row
+
+from lab_1 import MatrixFormatter
+from matrix_format import write_array
+
+SIZES = [500, 1000, 2000, 5000]
+# Построчная печать через список строк на все элементы — только до этого размера
+LIST_MAX_N = 2000
+
+
+def print_via_lists(A, stream):
+    """Прежняя схема: список списков отформатированных строк, затем печать построчно"""
+    for row in MatrixFormatter.format_matrix(A.tolist(), 4):
+        stream.write("  ".join(row) + "\n")
+
+
+def peak_mb(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    print_row("n", "lists, s", "peak, MB", "savetxt, s", "peak, MB", "head/tail, s")
+    with open(os.devnull, "w", buffering=1 << 20) as sink:
+        for n in SIZES:
+            A = np.random.default_rng(n).standard_normal((n, n))
+            row = [n]
+            if n <= LIST_MAX_N:
+                row += [best_time(print_via_lists, A, sink, repeat=1)[0], peak_mb(lambda: print_via_lists(A, sink))]
+            else:
+                row += ["-", "-"]
+            row += [best_time(write_array, A, sink, repeat=1)[0], peak_mb(lambda: write_array(A, sink))]
+            row.append(best_time(lambda: write_array(A, sink, edge_rows=5, summary=True), repeat=1)[0])
+            print_row(*row)
+
+
+if __name__ == "__main__":
+    main()
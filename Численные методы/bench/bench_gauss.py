@@ -0,0 +1,64 @@
+from copy import copy, deepcopy
+
+import numpy as np
+from common import best_time, print_row, random_system
+
+from lab_1 import LinearAlgebraSolver
+
+SIZES = [10, 20, 50, 100, 200, 500, 1000, 2000]
+# Прежняя реализация на списках — O(n^3) интерпретируемых операций, дальше ждать слишком долго
+REFERENCE_MAX_N = 500
+
+
+def gauss_elimination_lists(A, f):
+    """Прежняя реализация LinearAlgebraSolver.gauss_elimination на списках"""
+    n = len(f)
+    A = deepcopy(A)
+    f_copy = copy(f)
+
+    for i in range(n):
+        max_row = i
+        for k in range(i + 1, n):
+            if abs(A[k][i]) > abs(A[max_row][i]):
+                max_row = k
+
+        if max_row != i:
+            A[i], A[max_row] = A[max_row], A[i]
+            f_copy[i], f_copy[max_row] = f_copy[max_row], f_copy[i]
+
+        for j in range(i + 1, n):
+            factor = A[j][i] / A[i][i]
+            for k in range(i, n):
+                A[j][k] -= factor * A[i][k]
+            f_copy[j] -= factor * f_copy[i]
+
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        x[i] = f_copy[i]
+        for j in range(i + 1, n):
+            x[i] -= A[i][j] * x[j]
+        x[i] /= A[i][i]
+
+    return x
+
+
+def main():
+    print_row("n", "lists, s", "numpy(list), s", "ndarray, s", "speedup", "residual")
+    for n in SIZES:
+        A, f = random_system(n)
+        A_list, f_list = A.tolist(), f.tolist()
+        repeat = 3 if n <= 500 else 1
+
+        t_list, _ = best_time(LinearAlgebraSolver.gauss_elimination, A_list, f_list, repeat=repeat)
+        t_array, x = best_time(LinearAlgebraSolver.gauss_elimination, A, f, repeat=repeat)
+        residual = np.linalg.norm(A @ x - f, np.inf)
+
+        if n <= REFERENCE_MAX_N:
+            t_ref, _ = best_time(gauss_elimination_lists, A_list, f_list, repeat=1)
+            print_row(n, t_ref, t_list, t_array, t_ref / t_array, residual)
+        else:
+            print_row(n, "-", t_list, t_array, "-", residual)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import numpy as np
+import scipy.sparse as sp
+from common import best_time, print_row
+from scipy.sparse.linalg import eigsh
+
+from krylov_eigen import lanczos
+
+SIZES = [10_000, 100_000, 1_000_000]
+K = 5
+NNZ_PER_ROW = 5
+EIGSH_MAX_N = 100_000
+
+
+def random_graph(n, seed=0):
+    """Симметричная разреженная матрица случайного графа, около 2 * NNZ_PER_ROW элементов в строке"""
+    rng = np.random.default_rng(seed)
+    nnz = NNZ_PER_ROW * n
+    M = sp.coo_matrix((rng.uniform(size=nnz), (rng.integers(n, size=nnz), rng.integers(n, size=nnz))), shape=(n, n))
+    return (M + M.T).tocsr()
+
+
+def main():
+    print_row("n", "reorth", "time, s", "matvecs", "restarts", "residual", "basis, MB", "eigsh, s")
+    for n in SIZES:
+        A = random_graph(n)
+        t_ref = "-"
+        if n <= EIGSH_MAX_N:
+            t_ref, _ = best_time(eigsh, A, K, None, None, "LA", repeat=1)
+        for reorth in ("full", "selective"):
+            t, res = best_time(lambda: lanczos(A, K, "LA", reorth=reorth), repeat=1)
+            m = max(2 * K + 10, 20)
+            print_row(n, reorth, t, res["matvecs"], res["restarts"], res["residual"], 8 * n * (m + 1) / 2**20, t_ref)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import numpy as np
+from common import best_time, print_row
+from numpy.polynomial import chebyshev
+
+from lab_4 import DiscreteOrthogonalBasis
+
+POINTS = [10_000, 100_000, 1_000_000]
+DEGREES = [3, 20, 50]
+
+
+def fit(t, y, deg):
+    basis = DiscreteOrthogonalBasis(t, deg)
+    return basis, basis.fit(y)
+
+
+def main():
+    print_row("N", "deg", "recurrence, s", "chebfit, s", "max diff")
+    rng = np.random.default_rng(0)
+    for n in POINTS:
+        t = np.sort(rng.uniform(-1.0, 1.0, n))
+        y = np.exp(t) * np.sin(20.0 * t) + 0.01 * rng.standard_normal(n)
+        for deg in DEGREES:
+            t_rec, (basis, ck) = best_time(fit, t, y, deg, repeat=1)
+            t_np, c_np = best_time(chebyshev.chebfit, t, y, deg, repeat=1)
+            diff = np.abs(basis.evaluate(ck, t) - chebyshev.chebval(t, c_np)).max()
+            print_row(n, deg, t_rec, t_np, diff)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import numpy as np
+from common import best_time, print_row
+
+from matrix_kernels import NUMPY_THRESHOLD, matmul, matmul_blocked, matmul_naive
+
+# Квадратные и прямоугольные случаи (n, p, m): A — n x p, B — p x m
+SHAPES = [(4, 4, 4), (8, 8, 8), (12, 12, 12), (16, 16, 16), (32, 32, 32), (64, 64, 64),
+          (128, 128, 128), (256, 256, 256), (4, 4, 1), (200, 50, 3), (3, 500, 400)]
+NAIVE_MAX_OPS = 128 ** 3
+
+
+def numpy_from_lists(A, B):
+    return (np.array(A) @ np.array(B)).tolist()
+
+
+def main():
+    print(f"Порог numpy в matmul: n*p*m >= {NUMPY_THRESHOLD}")
+    print_row("shape", "naive, s", "blocked, s", "numpy, s", "matmul, s", "max|err|")
+    rng = np.random.default_rng(0)
+    for n, p, m in SHAPES:
+        A = rng.standard_normal((n, p)).tolist()
+        B = rng.standard_normal((p, m)).tolist()
+        repeat = 5 if n * p * m <= 64 ** 3 else 1
+
+        t_blocked, C = best_time(matmul_blocked, A, B, repeat=repeat)
+        t_numpy, C_ref = best_time(numpy_from_lists, A, B, repeat=repeat)
+        t_auto, _ = best_time(matmul, A, B, repeat=repeat)
+        err = np.abs(np.array(C) - np.array(C_ref)).max()
+
+        t_naive = best_time(matmul_naive, A, B, repeat=repeat)[0] if n * p * m <= NAIVE_MAX_OPS else "-"
+        print_row(f"{n}x{p}x{m}", t_naive, t_blocked, t_numpy, t_auto, err)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import numpy as np
+from common import best_time, print_row
+
+from lab_3 import F_batch, F_vec, J_batch, J_mat, newton, newton_batch, newton_pool, seidel_batch
+
+BATCH_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+LOOP_MAX_K = 10 ** 4
+
+
+def newton_loop(X0):
+    return [newton(F_vec, J_mat, x0) for x0 in X0]
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print_row("K", "method", "time, s", "converged", "max iters")
+    for K in BATCH_SIZES:
+        X0 = rng.uniform(-2.0, 2.0, size=(K, 3))
+        runs = [
+            ("newton batch", lambda: newton_batch(F_batch, J_batch, X0)),
+            # Зейдель сходится только вблизи корня, поэтому стартуем из окрестности x0 лабораторной
+            ("seidel batch", lambda: seidel_batch(0.1 * X0)),
+        ]
+        if K <= LOOP_MAX_K:
+            runs.append(("newton pool", lambda: newton_pool(F_vec, J_mat, X0)))
+        for name, run in runs:
+            t, result = best_time(run, repeat=1)
+            print_row(K, name, t, int(result["converged"].sum()), int(result["iterations"].max()))
+        if K <= LOOP_MAX_K:
+            t, results = best_time(newton_loop, X0, repeat=1)
+            print_row(K, "newton loop", t, sum(r["converged"] for r in results), max(r["iterations"] for r in results))
+
+
+if __name__ == "__main__":
+    main()
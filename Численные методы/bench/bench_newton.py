@@ -0,0 +1,54 @@
+import numpy as np
+from common import best_time, print_row
+
+from lab_3 import newton
+
+# Система F_vec из lab_3, повторённая по блокам (x_b, y_b, z_b) и слабо связанная с соседними блоками
+SIZES = [3, 30, 300, 1500]
+FD_MAX_N = 300
+COUPLING = 0.01
+
+
+def F_scaled(u):
+    x, y, z = u[0::3], u[1::3], u[2::3]
+    F = np.empty_like(u)
+    F[0::3] = x + x * x - 2 * y * z - 0.1
+    F[1::3] = y - y * y + 3 * x * z + 0.2
+    F[2::3] = z + z * z + 2 * x * y - 0.3
+    F[3:] += COUPLING * u[:-3]
+    F[:-3] += COUPLING * u[3:]
+    return F
+
+
+def J_scaled(u):
+    n = u.size
+    x, y, z = u[0::3], u[1::3], u[2::3]
+    J = np.zeros((n, n))
+    blocks = np.array([
+        [1 + 2 * x, -2 * z, -2 * y],
+        [3 * z, 1 - 2 * y, 3 * x],
+        [2 * y, 2 * x, 1 + 2 * z],
+    ])
+    b = np.arange(n // 3)
+    for r in range(3):
+        for c in range(3):
+            J[3 * b + r, 3 * b + c] = blocks[r, c]
+    J += COUPLING * (np.eye(n, k=3) + np.eye(n, k=-3))
+    return J
+
+
+def main():
+    print_row("n", "mode", "time, s", "iterations", "LU count", "||F(x)||")
+    for n in SIZES:
+        x0 = np.tile([0.1, -0.1, 0.1], n // 3)
+        modes = [("newton", J_scaled, 1), ("shamanskii-3", J_scaled, 3), ("chord", J_scaled, 50)]
+        if n <= FD_MAX_N:
+            modes.append(("fd-jacobian", None, 1))
+        for name, J, reuse in modes:
+            t, result = best_time(lambda: newton(F_scaled, J, x0, eps_x=1e-10, reuse=reuse), repeat=3)
+            residual = np.linalg.norm(F_scaled(result["x"]))
+            print_row(n, name, t, result["iterations"], result["factorizations"], residual)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import numpy as np
+from common import best_time, print_row, random_system
+
+from lu import LUFactorization
+from refinement import mixed_precision_solve
+
+SIZES = [50, 100, 250, 500, 1000, 2000, 3000]
+
+
+def backward_error(A, x, f):
+    scale = np.linalg.norm(A, np.inf) * np.linalg.norm(x, np.inf) + np.linalg.norm(f, np.inf)
+    return float(np.linalg.norm(A @ x - f, np.inf) / scale)
+
+
+def main():
+    print_row("n", "float64 LU, s", "error", "float32+refine, s", "error", "iterations", "speedup", width=18)
+    crossover = None
+    for n in SIZES:
+        A, f = random_system(n)
+        repeat = 3 if n <= 1000 else 1
+        t64, x64 = best_time(lambda: LUFactorization(A).solve(f), repeat=repeat)
+        t32, result = best_time(mixed_precision_solve, A, f, repeat=repeat)
+        if crossover is None and t32 < t64:
+            crossover = n
+        print_row(n, t64, backward_error(A, x64, f), t32, backward_error(A, result["x"], f),
+                  result["iterations"], t64 / t32, width=18)
+    if crossover is None:
+        print("Смешанная точность не обогнала float64 на проверенных размерах")
+    else:
+        print(f"Смешанная точность быстрее float64 начиная с n = {crossover}")
+
+
+if __name__ == "__main__":
+    main()
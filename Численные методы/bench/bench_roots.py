@@ -0,0 +1,47 @@
+import numpy as np
+from common import best_time, print_row
+
+from roots import real_roots
+
+DEGREES = [4, 10, 25, 50, 100]
+METHODS = ["sturm", "companion", "grid"]
+# Корни в точках деления пополам [-bound, bound]: 0, ±1, целые сетки, равномерная сетка на [-1, 1]
+STRUCTURED = {
+    "{-1, 0, 1}": [-1.0, 0.0, 1.0],
+    "0..4": [0.0, 1.0, 2.0, 3.0, 4.0],
+    "-10..10": list(range(-10, 11)),
+    "linspace(-1, 1, 21)": list(np.linspace(-1.0, 1.0, 21)),
+    "{0, 0, 1}": [0.0, 0.0, 1.0],
+}
+
+
+def root_error(x, exact):
+    """Наибольшая ошибка найденных различных корней; inf, если число корней не совпало"""
+    exact = np.unique(exact)
+    x = np.unique(np.round(x, 8))
+    return float(np.abs(x - exact).max()) if len(x) == len(exact) else float("inf")
+
+
+def check_structured():
+    print_row("roots", *(f"{m} error" for m in METHODS), width=22)
+    for name, roots in STRUCTURED.items():
+        coeffs = np.poly(roots)
+        print_row(name, *(root_error(real_roots(coeffs, None, method), roots) for method in METHODS), width=22)
+
+
+def main():
+    check_structured()
+    print_row("deg", *(f"{m}, s" for m in METHODS), *(f"{m} roots" for m in METHODS), width=16)
+    rng = np.random.default_rng(0)
+    for deg in DEGREES:
+        coeffs = rng.standard_normal(deg + 1)
+        times, counts = [], []
+        for method in METHODS:
+            t, x = best_time(real_roots, coeffs, None, method)
+            times.append(t)
+            counts.append(len(x))
+        print_row(deg, *times, *counts, width=16)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+from copy import copy, deepcopy
+from math import sqrt
+
+import numpy as np
+from common import best_time, print_row, random_system
+
+from lab_2 import GivensQR
+
+SIZES = [10, 50, 100, 200, 500, 1000, 2000]
+REFERENCE_MAX_N = 200
+# Поэлементные варианты (block_size=None) на n = 2000 идут около минуты — только до этого размера
+UNBLOCKED_MAX_N = 1000
+
+
+def method_rotations_lists(A, f):
+    """Прежняя реализация method_rotations на списках (с порогом пропуска 1e-6)"""
+    n = len(A)
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            if abs(A[j][i]) < 1e-6:
+                continue
+            r = sqrt(A[i][i] ** 2 + A[j][i] ** 2)
+            c = A[i][i] / r
+            s = A[j][i] / r
+            for k in range(i, n):
+                temp_i = A[i][k]
+                temp_j = A[j][k]
+                A[i][k] = c * temp_i + s * temp_j
+                A[j][k] = -s * temp_i + c * temp_j
+            temp_f_i = f[i]
+            temp_f_j = f[j]
+            f[i] = c * temp_f_i + s * temp_f_j
+            f[j] = -s * temp_f_i + c * temp_f_j
+
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        s = f[i]
+        for j in range(i + 1, n):
+            s -= A[i][j] * x[j]
+        x[i] = s / A[i][i]
+    return x
+
+
+def main():
+    print_row("n", "lists, s", "sequential, s", "staged, s", "blocked, s", "reuse Q, s", "residual")
+    for n in SIZES:
+        A, f = random_system(n)
+        repeat = 3 if n <= 200 else 1
+
+        t_blocked, qr = best_time(GivensQR, A, repeat=repeat)
+        # Повторное использование неявного Q для новой правой части
+        t_reuse, x = best_time(qr.solve, f, repeat=repeat)
+        residual = np.linalg.norm(A @ x - f, np.inf)
+        if n <= UNBLOCKED_MAX_N:
+            t_seq, qr_seq = best_time(lambda M: GivensQR(M, block_size=None), A, repeat=repeat)
+            t_staged, qr_staged = best_time(lambda M: GivensQR(M, staged=True, block_size=None), A, repeat=repeat)
+            residual = max(residual, *(np.linalg.norm(A @ other.solve(f) - f, np.inf) for other in (qr_seq, qr_staged)))
+        else:
+            t_seq = t_staged = "-"
+
+        if n <= REFERENCE_MAX_N:
+            t_ref, _ = best_time(lambda: method_rotations_lists(deepcopy(A.tolist()), copy(f.tolist())), repeat=1)
+        else:
+            t_ref = "-"
+        print_row(n, t_ref, t_seq, t_staged, t_blocked, t_reuse, residual)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Масштабирование solve_many и inverse по числу потоков.
+
+BLAS ограничивается одним потоком до импорта numpy, чтобы параллелизм давал только пул:
+    python bench_solve_many.py --n 4000 --block-size 256
+"""
+import os
+
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import argparse  # noqa: E402
+
+import numpy as np  # noqa: E402
+from common import best_time, print_row, random_system  # noqa: E402
+
+from lu import RHS_BLOCK_SIZE, LUFactorization  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=4000)
+    parser.add_argument("--block-size", type=int, default=RHS_BLOCK_SIZE)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    A, _ = random_system(args.n)
+    B = np.random.default_rng(1).standard_normal((args.n, args.n))
+    t_factor, lu = best_time(LUFactorization, A, repeat=1)
+    print(f"n = {args.n}, блок {args.block_size} столбцов, ядер {os.cpu_count()}, "
+          f"OPENBLAS_NUM_THREADS={os.environ['OPENBLAS_NUM_THREADS']}, разложение {t_factor:.3f} с")
+
+    print_row("workers", "solve_many, s", "speedup", "inverse, s", "speedup", "residual")
+    workers = 1
+    base = None
+    while workers <= args.max_workers:
+        t_solve, X = best_time(lambda: lu.solve_many(B, args.block_size, workers), repeat=args.repeat)
+        t_inv, _ = best_time(lambda: lu.inverse(args.block_size, workers), repeat=args.repeat)
+        base = base or (t_solve, t_inv)
+        residual = float(np.abs(A @ X - B).max() / (np.abs(A).max() * np.abs(X).max()))
+        print_row(workers, t_solve, base[0] / t_solve, t_inv, base[1] / t_inv, residual)
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
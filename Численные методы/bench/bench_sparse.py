@@ -0,0 +1,47 @@
+import numpy as np
+import scipy.sparse as sp
+from common import print_row
+
+from lab_1 import LinearAlgebraSolver
+
+GRIDS = [100, 200, 400]
+# Шаг по времени неявной схемы для уравнения теплопроводности в единицах h^2
+TAU = 10.0
+CONVECTION = 0.5
+METHODS = [
+    ("splu", None),
+    ("cg", None),
+    ("cg", "jacobi"),
+    ("cg", "ilu0"),
+    ("bicgstab", "jacobi"),
+    ("bicgstab", "ilu0"),
+]
+
+
+def heat_step_matrix(m, convection=0.0):
+    """I + τ (-Δ_h + c ∂_x) на сетке m × m: шаг неявной схемы, при c != 0 — несимметричная"""
+    main = np.full(m, 2.0)
+    off = np.ones(m - 1)
+    T = sp.diags([-off - convection, main, -off + convection], [-1, 0, 1])
+    D = sp.diags([-off, main, -off], [-1, 0, 1])
+    I = sp.identity(m)
+    return (sp.identity(m * m) + TAU * (sp.kron(I, T) + sp.kron(D, I))).tocsr()
+
+
+def main():
+    print_row("problem", "n", "method", "precond", "time, s", "iterations", "fill-in", "residual", width=12)
+    for name, convection in (("symmetric", 0.0), ("convection", CONVECTION)):
+        for m in GRIDS:
+            A = heat_step_matrix(m, convection)
+            f = np.random.default_rng(m).standard_normal(m * m)
+            for method, preconditioner in METHODS:
+                if method == "cg" and convection:
+                    continue
+                r = LinearAlgebraSolver.solve_sparse(A, f, method, preconditioner)
+                fill_in = "-" if r["fill_in"] is None else r["fill_in"]
+                print_row(name, m * m, method, preconditioner or "-", r["time"], r["iterations"], fill_in,
+                          r["residual"], width=12)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from common import best_time, print_row
+
+from streaming_fit import StreamingChebyshevFit, binary_chunks
+
+POINTS = [10**6, 10**7, 5 * 10**7]
+DEG = 20
+# Порция генерации файла, чтобы и сам файл не строился целиком в памяти
+WRITE_CHUNK = 10**6
+
+
+def write_points(path, n, seed=0):
+    rng = np.random.default_rng(seed)
+    with open(path, "wb") as f:
+        for i in range(0, n, WRITE_CHUNK):
+            x = rng.uniform(0.0, 1.0, min(WRITE_CHUNK, n - i))
+            np.column_stack([x, np.exp(x) * np.sin(20.0 * x)]).tofile(f)
+
+
+def fit_file(path):
+    return StreamingChebyshevFit(0.0, 1.0, DEG).consume(binary_chunks(path)).fit()
+
+
+def main():
+    print_row("N", "file, MB", "time, s", "peak, MB", "rms")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "points.bin"
+        for n in POINTS:
+            write_points(path, n)
+            tracemalloc.start()
+            t, res = best_time(fit_file, path, repeat=1)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print_row(n, path.stat().st_size / 2**20, t, peak / 2**20, res["rms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import numpy as np
+import scipy.sparse as sp
+from common import best_time, print_row
+from scipy.sparse.linalg import eigsh
+
+from lab_4 import subspace_iteration
+
+GRIDS = [50, 100, 200]
+K = 6
+FILTER_DEGREES = [0, 10, 20]
+EPS = 1e-6
+MAX_ITER = 2000
+
+
+def laplacian_2d(m):
+    """Пятиточечный лапласиан на сетке m x m — разреженная матрица порядка m^2"""
+    L = sp.diags([-np.ones(m - 1), 2.0 * np.ones(m), -np.ones(m - 1)], [-1, 0, 1])
+    I = sp.eye(m)
+    return (sp.kron(L, I) + sp.kron(I, L)).tocsr()
+
+
+def main():
+    print_row("n", "filter", "time, s", "matvecs", "residual", "eigsh, s", "max diff")
+    for m in GRIDS:
+        A = laplacian_2d(m)
+        t_ref, ref = best_time(eigsh, A, K, None, None, "LA", repeat=1)
+        ref = np.sort(ref[0])[::-1]
+        for degree in FILTER_DEGREES:
+            t, res = best_time(
+                lambda: subspace_iteration(A, K, eps=EPS, max_iter=MAX_ITER, filter_degree=degree), repeat=1
+            )
+            diff = float(np.abs(res["values"] - ref).max())
+            print_row(m * m, degree, t, res["matvecs"], res["residual"], t_ref, diff)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Лабораторные лежат в соседнем каталоге и импортируются по имени файла
+LABS_DIR = Path(__file__).resolve().parent.parent / "labs"
+if str(LABS_DIR) not in sys.path:
+    sys.path.insert(0, str(LABS_DIR))
+
+
+def best_time(fn, *args, repeat=3):
+    """Лучшее время из repeat запусков и результат последнего запуска"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def random_system(n, seed=0):
+    """Случайная хорошо обусловленная система A x = f размера n"""
+    rng = np.random.default_rng(seed)
+    A = rng.standard_normal((n, n)) + n * np.eye(n)
+    f = rng.standard_normal(n)
+    return A, f
+
+
+def print_row(*cells, width=16):
+    print("".join(
+        f"{cell:>{width}}" if isinstance(cell, (str, int)) else f"{cell:>{width}.4g}" for cell in cells
+    ))
@@ -0,0 +1,211 @@
+"""Набор замеров для решателей лабораторных и проверка регрессий относительно сохранённой базы.
+
+    python run_suite.py                           # замер, результаты в results.json
+    python run_suite.py --baseline baseline.json  # замер и сравнение с базой
+    python run_suite.py --update-baseline         # замер и запись новой базы
+"""
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from common import best_time, print_row, random_system
+
+from lab_1 import LinearAlgebraSolver
+from lab_2 import method_minimal_residuals, method_rotations
+from lab_3 import F_vec, newton_method
+from lab_4 import danilevski_strict, power_method
+from polynomial import Polynomial
+from roots import real_roots
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+
+
+def relative_residual(A, x, f):
+    """||A x - f|| / (||A|| ||x|| + ||f||) — обратная ошибка решения СЛАУ"""
+    A = np.asarray(A)
+    x = np.asarray(x)
+    f = np.asarray(f)
+    scale = np.linalg.norm(A, np.inf) * np.linalg.norm(x, np.inf) + np.linalg.norm(f, np.inf)
+    return float(np.linalg.norm(A @ x - f, np.inf) / scale)
+
+
+def symmetric_matrix(n, seed=0):
+    """Симметричная матрица с известным спектром из [1, 2] (сходятся и Данилевский, и степенной метод)"""
+    rng = np.random.default_rng(seed)
+    lam = np.linspace(1.0, 2.0, n)
+    lam[-1] = 3.0
+    Q = np.linalg.qr(rng.standard_normal((n, n)))[0]
+    return (Q * lam) @ Q.T, lam
+
+
+# Каждый случай по размеру n возвращает (функцию без аргументов, функцию невязки результата)
+def case_gauss_elimination(n):
+    A, f = random_system(n)
+    return (lambda: LinearAlgebraSolver.gauss_elimination(A, f)), (lambda x: relative_residual(A, x, f))
+
+
+def case_determinant(n):
+    A, _ = random_system(n)
+    A /= n  # иначе det ~ n^n переполняется
+    exact = np.linalg.det(A)
+    return (lambda: LinearAlgebraSolver.determinant(A)), (lambda d: abs(d - exact) / abs(exact))
+
+
+def case_inverse_matrix(n):
+    A, _ = random_system(n)
+    return (lambda: LinearAlgebraSolver.inverse_matrix(A)), (lambda X: float(np.abs(A @ X - np.eye(n)).max()))
+
+
+def case_method_rotations(n):
+    A, f = random_system(n)
+    return (lambda: method_rotations(A, f)), (lambda x: relative_residual(A, x, f))
+
+
+def case_method_minimal_residuals(n):
+    A, f = random_system(n)
+    x0 = np.zeros(n)
+    return (lambda: method_minimal_residuals(A, f, x0, 1e-10)), (lambda res: relative_residual(A, res[0], f))
+
+
+def case_newton_method(n):
+    x0 = [0.0] * n
+    return (lambda: newton_method(x0)), (lambda res: float(np.abs(F_vec(res[0])).max()))
+
+
+def case_danilevski_strict(n):
+    A, lam = symmetric_matrix(n)
+    exact = np.poly(lam)
+    A_list = A.tolist()
+    return (lambda: danilevski_strict(A_list)), (
+        lambda res: float(np.abs(np.array(res[1]) - exact).max() / np.abs(exact).max())
+    )
+
+
+def case_real_roots(n):
+    coeffs = np.random.default_rng(n).standard_normal(n + 1)
+    poly = Polynomial.from_desc(coeffs)
+    abs_poly = Polynomial(np.abs(poly.coeffs))
+
+    def backward_error(x):
+        return float(np.max(np.abs(poly(x)) / abs_poly(np.abs(x)), initial=0.0))
+
+    return (lambda: real_roots(coeffs)), backward_error
+
+
+def case_real_roots_grid(n):
+    """Целые корни -n..n: нуль и ±2^k — точки деления пополам при отделении корней"""
+    exact = np.arange(-n, n + 1, dtype=float)
+    coeffs = np.poly(exact)
+
+    def error(x):
+        return float(np.abs(x - exact).max()) if len(x) == len(exact) else float("inf")
+
+    return (lambda: real_roots(coeffs)), error
+
+
+def case_power_method(n):
+    A, lam = symmetric_matrix(n)
+    A_list = A.tolist()
+    return (lambda: power_method(A_list, eps=1e-10)), (lambda res: abs(res[0] - lam[-1]))
+
+
+CASES = {
+    "gauss_elimination": (case_gauss_elimination, [50, 200, 500]),
+    "determinant": (case_determinant, [50, 200, 500]),
+    "inverse_matrix": (case_inverse_matrix, [50, 200, 500]),
+    "method_rotations": (case_method_rotations, [50, 200, 500]),
+    "method_minimal_residuals": (case_method_minimal_residuals, [50, 200, 500]),
+    "newton_method": (case_newton_method, [3]),
+    "danilevski_strict": (case_danilevski_strict, [4, 8, 12]),
+    "real_roots": (case_real_roots, [10, 50, 100]),
+    "real_roots_grid": (case_real_roots_grid, [1, 4, 8]),
+    "power_method": (case_power_method, [10, 50, 100]),
+}
+
+
+def measure(fn, residual, repeat):
+    """Лучшее время, пик памяти по tracemalloc (отдельный прогон) и невязка результата"""
+    t, result = best_time(fn, repeat=repeat)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"time": t, "peak_mb": peak / 2**20, "residual": float(residual(result))}
+
+
+def run(names, repeat):
+    results = {}
+    print(f"{'case':<32}", end="")
+    print_row("time, s", "peak, MB", "residual", width=12)
+    for name in names:
+        make, sizes = CASES[name]
+        for n in sizes:
+            fn, residual = make(n)
+            key = f"{name}/n={n}"
+            results[key] = record = measure(fn, residual, repeat)
+            print(f"{key:<32}", end="")
+            print_row(record["time"], record["peak_mb"], record["residual"], width=12)
+    return results
+
+
+def compare(results, baseline, tolerance, residual_factor, min_time=1e-3):
+    """Список регрессий: время и память хуже базы больше чем в (1 + tolerance) раз
+    (время — ещё и больше чем на min_time, чтобы не реагировать на шум коротких замеров),
+    невязка — больше чем в residual_factor раз (и выше машинного уровня)."""
+    problems = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if new["time"] > old["time"] * (1.0 + tolerance) + min_time:
+            problems.append(f"{key}: время {old['time']:.4g} -> {new['time']:.4g} с")
+        if new["peak_mb"] > old["peak_mb"] * (1.0 + tolerance) + 0.1:
+            problems.append(f"{key}: память {old['peak_mb']:.4g} -> {new['peak_mb']:.4g} МБ")
+        limit = max(old["residual"] * residual_factor, 1e-13)
+        if not new["residual"] <= limit:
+            problems.append(f"{key}: невязка {old['residual']:.3g} -> {new['residual']:.3g}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", help="по умолчанию — все: " + ", ".join(CASES))
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустимый рост времени и памяти")
+    parser.add_argument("--residual-factor", type=float, default=10.0, help="допустимый рост невязки")
+    parser.add_argument("--min-time", type=float, default=1e-3, help="допустимый рост времени в секундах")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error("неизвестные случаи: " + ", ".join(sorted(unknown)))
+
+    results = run(args.cases or list(CASES), args.repeat)
+    report = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine()},
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    if args.update_baseline:
+        (args.baseline or DEFAULT_BASELINE).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text())["results"]
+    problems = compare(results, baseline, args.tolerance, args.residual_factor, args.min_time)
+    for line in problems:
+        print("РЕГРЕССИЯ " + line)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import numpy as np
+
+
+def hessenberg(A) -> np.ndarray:
+    """Верхняя форма Хессенберга H = Q^T A Q отражениями Хаусхолдера.
+
+    На шаге k отражение обнуляет столбец k ниже поддиагонали и применяется к строкам
+    и столбцам k+1: двумя ранг-1 обновлениями; всего O(n^3). Собственные значения
+    (и характеристический многочлен) H совпадают с A.
+    """
+    H = np.array(A, dtype=float)
+    n = H.shape[0]
+    if H.ndim != 2 or H.shape[1] != n:
+        raise ValueError("Матрица должна быть квадратной")
+    for k in range(n - 2):
+        x = H[k + 1:, k]
+        norm_x = np.linalg.norm(x)
+        if norm_x == 0.0 or np.linalg.norm(x[1:]) == 0.0:
+            continue
+        v = x.copy()
+        v[0] += norm_x if x[0] >= 0 else -norm_x
+        v /= np.linalg.norm(v)
+        H[k + 1:, k:] -= 2.0 * np.outer(v, v @ H[k + 1:, k:])
+        H[:, k + 1:] -= 2.0 * np.outer(H[:, k + 1:] @ v, v)
+        H[k + 2:, k] = 0.0
+    return H
+
+
+def la_budde_charpoly(H):
+    """Коэффициенты det(λI - H) = λ^n + c_1 λ^(n-1) + ... + c_n для верхней хессенберговой H.
+
+    Рекуррентность Ла Будде по ведущим подматрицам:
+        p_i(λ) = (λ - h_ii) p_{i-1}(λ) - sum_m h_{i-m,i} β_i ... β_{i-m+1} p_{i-m-1}(λ),
+    где β_j = h_{j,j-1}. Сумма по m — одно произведение вектора весов на матрицу
+    коэффициентов предыдущих p_k, так что шаг стоит O(n^2), а весь многочлен — O(n^3).
+    """
+    H = np.asarray(H, dtype=float)
+    n = H.shape[0]
+    sub = np.diag(H, -1)
+    P = np.zeros((n + 1, n + 1))  # P[k, :k+1] — коэффициенты p_k по возрастанию степеней
+    P[0, 0] = 1.0
+    for i in range(1, n + 1):
+        P[i, 1:i + 1] = P[i - 1, :i]
+        P[i, :i] -= H[i - 1, i - 1] * P[i - 1, :i]
+        if i > 1:
+            weights = H[i - 2::-1, i - 1] * np.cumprod(sub[i - 2::-1])
+            P[i, :i - 1] -= weights @ P[i - 2::-1, :i - 1]
+    return P[n, ::-1].tolist()
+
+
+def hyman_charpoly_value(H, x):
+    """Значение det(λI - H) методом Хаймана сразу во всех точках x, O(n^2) на точку.
+
+    Для z с z_n = 1 строки 2..n системы (H - λI) z = 0 решаются снизу вверх через поддиагональ;
+    тогда det(H - λI) = (-1)^(n-1) β_2 ... β_n · (первая строка (H - λI) z).
+    Нужна неприводимая H (все β_j != 0).
+    """
+    H = np.asarray(H, dtype=float)
+    lam = np.asarray(x, dtype=float)
+    n = H.shape[0]
+    sub = np.diag(H, -1)
+    if np.any(sub == 0.0):
+        raise ValueError("Форма Хессенберга приводима: нулевой поддиагональный элемент")
+    z = np.zeros((n,) + lam.shape)
+    z[n - 1] = 1.0
+    for i in range(n - 1, 0, -1):
+        s = np.tensordot(H[i, i:], z[i:], axes=1) - lam * z[i]
+        z[i - 1] = -s / sub[i - 1]
+    first = np.tensordot(H[0], z, axes=1) - lam * z[0]
+    det = (-1.0) ** (n - 1) * np.prod(sub) * first
+    return (-1.0) ** n * det
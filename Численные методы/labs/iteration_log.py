@@ -0,0 +1,78 @@
+from time import perf_counter
+
+import numpy as np
+
+
+class IterationLog:
+    """Журнал сходимости итерационного метода в заранее выделенных массивах numpy.
+
+    На каждой итерации сохраняются итерат (dim чисел; dim=0 — не сохранять), норма невязки,
+    время от создания журнала и, при value_dim > 0, вектор значений (например, F(x)).
+    Массивы растут удвоением, поэтому запись стоит амортизированно O(dim).
+    Чтобы отключить журнал, решателям передаётся log=None.
+    """
+
+    def __init__(self, dim: int, value_dim: int = 0, capacity: int = 64):
+        self.dim = dim
+        self.value_dim = value_dim
+        self.size = 0
+        self._iterates = np.empty((capacity, dim))
+        self._values = np.empty((capacity, value_dim))
+        self._residuals = np.empty(capacity)
+        self._times = np.empty(capacity)
+        self._start = perf_counter()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._residuals)
+        for name in ("_iterates", "_values", "_residuals", "_times"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:])
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def append(self, x, residual: float, values=None) -> None:
+        """Запись итерации; x=None — итерат не сформирован (строка заполняется nan)"""
+        if self.size == len(self._residuals):
+            self._grow()
+        i = self.size
+        if self.dim:
+            self._iterates[i] = np.nan if x is None else x
+        if self.value_dim:
+            self._values[i] = np.nan if values is None else values
+        self._residuals[i] = residual
+        self._times[i] = perf_counter() - self._start
+        self.size += 1
+
+    @property
+    def iterates(self) -> np.ndarray:
+        return self._iterates[:self.size]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[:self.size]
+
+    @property
+    def residuals(self) -> np.ndarray:
+        return self._residuals[:self.size]
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times[:self.size]
+
+    def save(self, path) -> None:
+        """Выгрузка журнала в .npz для последующего анализа"""
+        np.savez(path, iterates=self.iterates, values=self.values, residuals=self.residuals, times=self.times)
+
+    @classmethod
+    def load(cls, path) -> "IterationLog":
+        with np.load(path) as data:
+            log = cls(data["iterates"].shape[1], data["values"].shape[1], capacity=max(len(data["residuals"]), 1))
+            log.size = len(data["residuals"])
+            log._iterates[:log.size] = data["iterates"]
+            log._values[:log.size] = data["values"]
+            log._residuals[:log.size] = data["residuals"]
+            log._times[:log.size] = data["times"]
+        return log
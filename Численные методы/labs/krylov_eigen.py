@@ -0,0 +1,171 @@
+from time import perf_counter
+
+import numpy as np
+
+from operators import as_operator
+
+# Порядок собственных значений для which: ключ, по убыванию которого значения «нужнее»
+ORDER_KEYS = {
+    "LA": lambda z: z.real,
+    "SA": lambda z: -z.real,
+    "LM": np.abs,
+    "LR": lambda z: z.real,
+}
+
+
+def _orthogonalize(w, *blocks):
+    """Двукратный блочный Грам — Шмидт w против строк блоков; возвращает все коэффициенты.
+
+    Базис хранится по строкам, поэтому блоки — срезы без копирования.
+    """
+    h = [np.zeros(len(B)) for B in blocks]
+    for _ in range(2):
+        for hi, B in zip(h, blocks):
+            dh = B @ w
+            w -= B.T @ dh
+            hi += dh
+    return np.concatenate(h)
+
+
+def _result(values, vectors, restarts, converged, matvecs, start, residual):
+    return {
+        "values": values,
+        "vectors": vectors,
+        "restarts": restarts,
+        "converged": bool(converged),
+        "matvecs": matvecs,
+        "time": perf_counter() - start,
+        "residual": residual,
+    }
+
+
+def lanczos(A, k, which="LA", n=None, m=None, tol=1e-8, max_restarts=200, reorth="full", seed=0):
+    """k крайних собственных пар симметричной матрицы методом Ланцоша с толстым перезапуском.
+
+    A — матрица, scipy.sparse, LinearOperator или функция умножения x -> A x (тогда нужен n).
+    which: "LA" — наибольшие, "SA" — наименьшие, "LM" — наибольшие по модулю.
+    Базис из m векторов (по умолчанию max(2k + 10, 20)) занимает 8 n (m + 1) байт — память
+    ограничена при любом числе перезапусков. После цикла из m шагов оставляются
+    k + (m - k) // 2 лучших векторов Ритца (Ву — Саймон), матрица становится «стрелкой».
+    reorth="full" — ортогонализация к всему базису на каждом шаге; reorth="selective" — только
+    к сохранённым векторам Ритца и двум последним векторам Ланцоша, O(n (p + 2)) вместо O(n j).
+    Сходимость пары i — оценка невязки |beta_m s_{m,i}| <= tol max(1, |θ_i|); converged=False
+    в результате — max_restarts исчерпан и пары возвращены несошедшимися.
+    """
+    matvec, n = as_operator(A, n)
+    if reorth not in ("full", "selective"):
+        raise ValueError(f"Неизвестный режим ортогонализации: {reorth}")
+    key = ORDER_KEYS[which]
+    m = min(n, m or max(2 * k + 10, 20))
+    keep = k + (m - k) // 2
+
+    start = perf_counter()
+    V = np.empty((m + 1, n))
+    v0 = np.random.default_rng(seed).standard_normal(n)
+    V[0] = v0 / np.linalg.norm(v0)
+    T = np.zeros((m, m))
+    p = 0
+    matvecs = 0
+    for restart in range(max_restarts + 1):
+        beta = 0.0
+        for j in range(p, m):
+            w = matvec(V[j])
+            matvecs += 1
+            if reorth == "full" or j == p:
+                idx = np.arange(j + 1)
+                h = _orthogonalize(w, V[:j + 1])
+            else:
+                idx = np.r_[np.arange(p), j - 1, j]
+                h = _orthogonalize(w, V[:p], V[j - 1:j + 1])
+            T[idx, j] = h
+            T[j, idx] = h
+            beta = np.linalg.norm(w)
+            if j + 1 < m:
+                T[j + 1, j] = T[j, j + 1] = beta
+            if beta == 0.0:
+                # Инвариантное подпространство: продолжение случайным ортогональным вектором
+                w = np.random.default_rng(seed + j + 1).standard_normal(n)
+                _orthogonalize(w, V[:j + 1])
+                if j + 1 < m:
+                    T[j + 1, j] = T[j, j + 1] = 0.0
+                V[j + 1] = w / np.linalg.norm(w)
+            else:
+                V[j + 1] = w / beta
+
+        theta, S = np.linalg.eigh(T)
+        order = np.argsort(-key(theta))
+        theta, S = theta[order], S[:, order]
+        residual = np.abs(beta * S[m - 1])
+        converged = np.all(residual[:k] <= tol * np.maximum(1.0, np.abs(theta[:k])))
+        if converged or restart == max_restarts or m == n:
+            return _result(theta[:k], V[:m].T @ S[:, :k], restart, converged, matvecs, start,
+                           float(residual[:k].max()))
+
+        # Толстый перезапуск: V[:keep] — векторы Ритца, V[keep] — прежний вектор невязки
+        V[:keep] = S[:, :keep].T @ V[:m]
+        V[keep] = V[m]
+        T = np.zeros((m, m))
+        T[:keep, :keep] = np.diag(theta[:keep])
+        T[:keep, keep] = T[keep, :keep] = beta * S[m - 1, :keep]
+        p = keep
+
+
+def arnoldi(A, k, which="LM", n=None, m=None, tol=1e-8, max_restarts=200, seed=0):
+    """k собственных значений несимметричной матрицы методом Арнольди с перезапуском Крылова — Шура.
+
+    which: "LM" — наибольшие по модулю, "LR" — с наибольшей вещественной частью.
+    Ортогонализация полная (двукратный Грам — Шмидт). При перезапуске малая матрица H
+    приводится к вещественной форме Шура с нужными значениями в левом верхнем блоке
+    (scipy.linalg.schur, импортируется только здесь); комплексно-сопряжённые пары не разрываются.
+    Собственные значения и векторы возвращаются комплексными; converged — как в lanczos.
+    """
+    from scipy.linalg import schur
+
+    matvec, n = as_operator(A, n)
+    key = ORDER_KEYS[which]
+    m = min(n, m or max(2 * k + 10, 20))
+    keep = k + (m - k) // 2
+
+    start = perf_counter()
+    V = np.empty((m + 1, n))
+    v0 = np.random.default_rng(seed).standard_normal(n)
+    V[0] = v0 / np.linalg.norm(v0)
+    H = np.zeros((m, m))
+    p = 0
+    matvecs = 0
+    for restart in range(max_restarts + 1):
+        beta = 0.0
+        for j in range(p, m):
+            w = matvec(V[j])
+            matvecs += 1
+            H[:j + 1, j] = _orthogonalize(w, V[:j + 1])
+            beta = np.linalg.norm(w)
+            if j + 1 < m:
+                H[j + 1, j] = beta
+            if beta == 0.0:
+                w = np.random.default_rng(seed + j + 1).standard_normal(n)
+                _orthogonalize(w, V[:j + 1])
+                if j + 1 < m:
+                    H[j + 1, j] = 0.0
+                V[j + 1] = w / np.linalg.norm(w)
+            else:
+                V[j + 1] = w / beta
+
+        theta, Y = np.linalg.eig(H)
+        order = np.argsort(-key(theta), kind="stable")
+        theta, Y = theta[order], Y[:, order]
+        residual = np.abs(beta * Y[m - 1])
+        converged = np.all(residual[:k] <= tol * np.maximum(1.0, np.abs(theta[:k])))
+        if converged or restart == max_restarts or m == n:
+            return _result(theta[:k], V[:m].T @ Y[:, :k], restart, converged, matvecs, start,
+                           float(residual[:k].max()))
+
+        threshold = key(theta[keep - 1])
+        margin = 1e-12 * max(1.0, abs(threshold))
+        T, Z, sdim = schur(H, output="real", sort=lambda re, im: key(re + 1j * im) >= threshold - margin)
+        V[:sdim] = Z[:, :sdim].T @ V[:m]
+        V[sdim] = V[m]
+        H = np.zeros((m, m))
+        H[:sdim, :sdim] = T[:sdim, :sdim]
+        H[sdim, :sdim] = beta * Z[m - 1, :sdim]
+        p = sdim
@@ -1,93 +1,104 @@
-from copy import deepcopy, copy
-
 import numpy
 
+from lu import RHS_BLOCK_SIZE, LUFactorization
+from matrix_format import write_array
+from matrix_kernels import matmul
+from refinement import mixed_precision_solve
+from sparse_solvers import is_sparse, sparse_solve
+
 
 class LinearAlgebraSolver:
     @staticmethod
-    def gauss_elimination(A: list[list[float]], f: list[float]) -> list[float]:
-        """Решение СЛАУ методом Гаусса с частичным выбором ведущего элемента"""
-        n = len(f)
-        A = deepcopy(A)
-        f_copy = copy(f)
+    def gauss_elimination(
+        A: list[list[float]] | numpy.ndarray, f: list[float] | numpy.ndarray, mixed_precision: bool = False
+    ) -> list[float] | numpy.ndarray:
+        """Решение СЛАУ методом Гаусса с частичным выбором ведущего элемента.
+
+        Для списков возвращает список, для numpy.ndarray — массив без лишних преобразований.
+        mixed_precision=True: разложение в float32 и итерационное уточнение до точности float64.
+        Матрицы scipy.sparse передаются в solve_sparse с выбором метода по умолчанию.
+        """
+        if is_sparse(A):
+            result = LinearAlgebraSolver.solve_sparse(A, f)
+            if not result["converged"]:
+                raise ValueError(
+                    f"{result['method']} не сошёлся за {result['iterations']} итераций "
+                    f"(невязка {result['residual']:.2e})"
+                )
+            return result["x"]
+        as_list = not isinstance(A, numpy.ndarray)
+        if mixed_precision:
+            x = mixed_precision_solve(A, f)["x"]
+            return x.tolist() if as_list else x
+        A = numpy.array(A, dtype=float)
+        f_copy = numpy.array(f, dtype=float)
+        n = len(f_copy)
+        # Ведущий элемент не больше eps * ||A|| считается нулём
+        tiny = numpy.finfo(float).eps * numpy.abs(A).sum(axis=1).max(initial=0.0)
 
         # Прямой ход
         for i in range(n):
             # Выбор ведущего элемента
-            max_row = i
-            for k in range(i + 1, n):
-                if abs(A[k][i]) > abs(A[max_row][i]):
-                    max_row = k
+            max_row = i + int(numpy.argmax(numpy.abs(A[i:, i])))
+            if abs(A[max_row, i]) <= tiny:
+                raise ValueError("Матрица вырождена")
 
             # Перестановка строк
             if max_row != i:
-                A[i], A[max_row] = A[max_row], A[i]
-                f_copy[i], f_copy[max_row] = f_copy[max_row], f_copy[i]
+                A[[i, max_row], i:] = A[[max_row, i], i:]
+                f_copy[[i, max_row]] = f_copy[[max_row, i]]
 
-            # Исключение переменной
-            for j in range(i + 1, n):
-                factor = A[j][i] / A[i][i]
-                for k in range(i, n):
-                    A[j][k] -= factor * A[i][k]
-                f_copy[j] -= factor * f_copy[i]
+            # Исключение переменной: ранг-1 обновление оставшейся подматрицы
+            factors = A[i + 1:, i] / A[i, i]
+            A[i + 1:, i:] -= numpy.outer(factors, A[i, i:])
+            f_copy[i + 1:] -= factors * f_copy[i]
 
         # Обратный ход
-        x = [0.0] * n
+        x = numpy.zeros(n)
         for i in range(n - 1, -1, -1):
-            x[i] = f_copy[i]
-            for j in range(i + 1, n):
-                x[i] -= A[i][j] * x[j]
-            x[i] /= A[i][i]
+            x[i] = (f_copy[i] - A[i, i + 1:] @ x[i + 1:]) / A[i, i]
 
-        return x
+        return x.tolist() if as_list else x
 
     @staticmethod
-    def determinant(A: list[list[float]]) -> float:
-        """Вычисление определителя матрицы методом Гаусса"""
-        n = len(A)
-        A_copy = [row[:] for row in A]
-        det_value = 1.0
+    def solve_sparse(A, f: list[float] | numpy.ndarray, method: str = "auto", preconditioner: str | None = "jacobi",
+                     tol: float = 1e-10) -> dict:
+        """Решение разреженной СЛАУ: разреженное LU или CG/BiCGSTAB с предобусловливателем.
 
-        for i in range(n):
-            # Выбор ведущего элемента
-            max_row = i
-            for k in range(i + 1, n):
-                if abs(A_copy[k][i]) > abs(A_copy[max_row][i]):
-                    max_row = k
+        method — "auto", "splu", "cg" или "bicgstab", preconditioner — "jacobi", "ilu0" или None
+        (подробнее в sparse_solvers.sparse_solve). Результат — словарь с x, методом, числом итераций,
+        признаком сходимости, заполнением множителей, временем и относительной невязкой.
+        """
+        return sparse_solve(A, f, method=method, preconditioner=preconditioner, tol=tol)
 
-            # Перестановка строк
-            if max_row != i:
-                A_copy[i], A_copy[max_row] = A_copy[max_row], A_copy[i]
-                det_value *= -1
-
-            # Проверка на вырожденность
-            if abs(A_copy[i][i]) < 1e-12:
-                return 0.0
-
-            det_value *= A_copy[i][i]
-
-            # Исключение
-            for j in range(i + 1, n):
-                factor = A_copy[j][i] / A_copy[i][i]
-                for k in range(i + 1, n):
-                    A_copy[j][k] -= factor * A_copy[i][k]
+    @staticmethod
+    def factorize(A: list[list[float]] | numpy.ndarray) -> LUFactorization:
+        """LU-разложение для повторного использования в det, inverse и solve"""
+        return LUFactorization(A)
 
-        return det_value
+    @staticmethod
+    def determinant(A: list[list[float]] | numpy.ndarray, lu: LUFactorization | None = None) -> float:
+        """Вычисление определителя матрицы через LU-разложение"""
+        lu = lu or LUFactorization(A)
+        return lu.det()
 
     @staticmethod
-    def inverse_matrix(A: list[list[float]]) -> list[list[float]]:
-        """Вычисление обратной матрицы методом Гаусса"""
-        n = len(A)
-        inv = [[0] * n for _ in range(n)]
-        # Решаем систему для каждого столбца единичной матрицы
-        for i in range(n):
-            e = [0.0] * n
-            e[i] = 1.0
-            col = LinearAlgebraSolver.gauss_elimination([row[:] for row in A], e)
-            for j in range(n):
-                inv[j][i] = col[j]
+    def solve_many(
+        A: list[list[float]] | numpy.ndarray, B: list[list[float]] | numpy.ndarray,
+        lu: LUFactorization | None = None, block_size: int = RHS_BLOCK_SIZE, workers: int | None = 1,
+    ) -> numpy.ndarray:
+        """Решение A X = B для всех столбцов B на одном LU-разложении; workers > 1 — блоки столбцов в пуле потоков"""
+        lu = lu or LUFactorization(A)
+        return lu.solve_many(B, block_size=block_size, workers=workers)
 
-        return inv
+    @staticmethod
+    def inverse_matrix(
+        A: list[list[float]] | numpy.ndarray, lu: LUFactorization | None = None, workers: int | None = 1
+    ) -> list[list[float]] | numpy.ndarray:
+        """Вычисление обратной матрицы: n правых частей на одном LU-разложении (workers > 1 — в пуле потоков)"""
+        lu = lu or LUFactorization(A)
+        inv = lu.inverse(workers=workers)
+        return inv if isinstance(A, numpy.ndarray) else inv.tolist()
 
     @staticmethod
     def matrix_vector_multiply(A: list[list[float]], x: list[float]) -> list[float]:
@@ -100,19 +111,17 @@ class LinearAlgebraSolver:
         return result
 
     @staticmethod
-    def matrix_multiply(A: list[list[float]], B: list[list[float]]) -> list[list[float]]:
-        """Умножение матриц"""
-        n = len(A)
-        C = [[0.0] * n for _ in range(n)]
-        for i in range(n):
-            for j in range(n):
-                for k in range(n):
-                    C[i][j] += A[i][k] * B[k][j]
-        return C
+    def matrix_multiply(
+        A: list[list[float]] | numpy.ndarray, B: list[list[float]] | numpy.ndarray
+    ) -> list[list[float]] | numpy.ndarray:
+        """Умножение матриц (общее ядро matrix_kernels.matmul)"""
+        return matmul(A, B)
 
     @staticmethod
     def residual_vector(A: list[list[float]], x: list[float], f: list[float]) -> list[float]:
         """Вычисление вектора невязки r = A*x - f"""
+        if is_sparse(A):
+            return A @ numpy.asarray(x, dtype=float) - numpy.asarray(f, dtype=float)
         r = LinearAlgebraSolver.matrix_vector_multiply(A, x)
         for i in range(len(r)):
             r[i] -= f[i]
@@ -131,21 +140,24 @@ class MatrixFormatter:
         return [f"{val:.{precision}f}" for val in vector]
 
     @staticmethod
-    def print_matrix(matrix: list[list[float]], name: str = "", precision: int = 4):
-        """Печать матрицы с заголовком"""
+    def print_matrix(matrix: list[list[float]] | numpy.ndarray, name: str = "", precision: int = 4,
+                     edge_rows: int | None = None, summary: bool = False, stream=None):
+        """Печать матрицы с заголовком построчно в поток (по умолчанию stdout).
+
+        edge_rows=k — только первые и последние k строк, summary=True — сводная строка
+        (размер, min, max, среднее, норма); см. matrix_format.write_array.
+        """
         if name:
-            print(f"{name} =")
-        formatted = MatrixFormatter.format_matrix(matrix, precision)
-        for row in formatted:
-            print('  '.join(row))
+            print(f"{name} =", file=stream)
+        write_array(matrix, stream, precision, edge_rows=edge_rows, summary=summary)
 
     @staticmethod
-    def print_vector(vector: list[float], name: str = "", precision: int = 4):
-        """Печать вектора с заголовком"""
+    def print_vector(vector: list[float] | numpy.ndarray, name: str = "", precision: int = 4,
+                     edge_rows: int | None = None, summary: bool = False, stream=None):
+        """Печать вектора с заголовком, по элементу в строке"""
         if name:
-            print(f"{name} =")
-        formatted = MatrixFormatter.format_vector(vector, precision)
-        print('\n'.join(formatted))
+            print(f"{name} =", file=stream)
+        write_array(vector, stream, precision, edge_rows=edge_rows, summary=summary)
 
 
 def main():
@@ -178,8 +190,11 @@ def main():
     for i, val in enumerate(r):
         print(f"  r{i + 1} = {val:.16f}")
 
+    # Одно LU-разложение на определитель и обратную матрицу
+    lu = solver.factorize(A)
+
     # Определитель
-    det_value = solver.determinant(A)
+    det_value = solver.determinant(A, lu)
     print(f"\nОпределитель det(A) = {det_value:.4f}")
 
     A_np = numpy.array(A)
@@ -187,7 +202,7 @@ def main():
     print(f"Определитель через numpy = {det_numpy:.4f}")
 
     # Обратная матрица
-    A_inv = solver.inverse_matrix(A)
+    A_inv = solver.inverse_matrix(A, lu)
     formatter.print_matrix(A_inv, "\nОбратная матрица A^-1", 4)
 
     # Проверка A * A^(-1) = E
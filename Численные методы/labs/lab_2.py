@@ -4,125 +4,372 @@
 
 
 from math import sqrt, floor
+from time import perf_counter
 from copy import deepcopy, copy
+from functools import partial
 
 import numpy as np
 
+from lu import LUFactorization
+from matrix_format import write_array
+from operators import as_operator
+from refinement import mixed_precision_solve
+
 
 class Printer:
     @staticmethod
     def first_order_matrix(array, name):
         print(f'{name}:')
-        for item in array:
-            print(f"{item:.4f}")
+        write_array(array)
 
     @staticmethod
     def second_order_matrix(array, name):
         print(f'{name}:')
-        for row in array:
-            print("  ".join(f"{item:.4f}" for item in row))
+        write_array(array)
 
     @staticmethod
     def residual(array):
         print(f"\nНевязка:")
-        for item in array:
-            print(f"{item:.16f}")
+        write_array(array, precision=16)
 
 
 def mn(A):
-    n = len(A)
-    max_sum = 0
-    for j in range(n):
-        col_sum = sum(abs(A[i][j]) for i in range(n))
-        if col_sum > max_sum:
-            max_sum = col_sum
-    return max_sum
+    # 1-норма: максимальная сумма модулей по столбцам
+    return float(np.abs(np.asarray(A, dtype=float)).sum(axis=0).max())
 
 
 def scalar_product(x, y):
     return sum(x_i * y_i for x_i, y_i in zip(x, y))
 
 
-def method_rotations(A, f):
-    n = len(A)
-
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            if abs(A[j][i]) < 1e-6:
+# Размер блока строк и столбцов в блочном разложении вращениями
+ROTATION_BLOCK_SIZE = 64
+
+
+def _rotate_stage(S, Q, p, q, cols, tol):
+    """Этап непересекающихся вращений строк p и q (срезы одной длины), обнуляющих S[q][k, cols[k]].
+
+    Срезы строк — представления без копирования; те же вращения применяются к строкам Q.
+    """
+    k = np.arange(len(cols))
+    a = S[p][k, cols]
+    b = S[q][k, cols]
+    keep = np.abs(b) > tol
+    if not keep.any():
+        return
+    r = np.where(keep, np.hypot(a, b), 1.0)
+    c = np.where(keep, a / r, 1.0)[:, None]
+    s = np.where(keep, b / r, 0.0)[:, None]
+    for M in (S, Q):
+        top, bottom = M[p], M[q]
+        new_top = c * top + s * bottom
+        bottom *= c
+        bottom -= s * top
+        top[...] = new_top
+    S[q][k, cols] = 0.0
+
+
+class GivensQR:
+    """QR-разложение вращениями: Q^T A = R.
+
+    Q хранится неявно, одно разложение можно применять к любому числу правых частей.
+    По умолчанию (block_size) разложение блочное: диагональный блок столбцов приводится
+    к треугольному виду схемой Самеха — Кука, затем каждый нижний блок строк обнуляется
+    вращениями пар (строка треугольника i, строка блока j) по этапам t = i + j.
+    Вращения блока копятся в ортогональной матрице, и к остальным столбцам она применяется
+    одним матричным умножением, а не поэлементно; Q хранится этими матрицами.
+    При block_size=None вращения применяются к строкам матрицы по одному и хранятся
+    строками (p, q) и параметрами (c, s); staged=True — схема Самеха — Кука на всей матрице:
+    вращения соседних строк (j-1, j), не пересекающиеся по строкам, объединяются
+    в 2n-3 параллельных этапа.
+    dtype=np.float32 — разложение в одинарной точности для итерационного уточнения.
+    """
+
+    def __init__(self, A, staged=False, tol=0.0, dtype=float, block_size=ROTATION_BLOCK_SIZE):
+        R = np.array(A, dtype=dtype)
+        self.n = R.shape[0]
+        self.staged = staged
+        self.block_size = block_size
+        self.blocks = []
+        self._rotations = ([], [], [], [])
+        self._stages = [0]
+        if block_size is not None:
+            self._factor_blocked(R, tol)
+        elif staged:
+            self._factor_staged(R, tol)
+        else:
+            self._factor_sequential(R, tol)
+        self.R = R
+        self.p, self.q, self.c, self.s = (np.array(v) for v in self._rotations)
+        self.stages = np.array(self._stages)
+
+    def _record(self, p, q, c, s):
+        for store, values in zip(self._rotations, (p, q, c, s)):
+            store.extend(np.atleast_1d(values).tolist())
+        self._stages.append(len(self._rotations[0]))
+
+    def _factor_blocked(self, R, tol):
+        n, nb = self.n, self.block_size
+        for k0 in range(0, n, nb):
+            k1 = min(k0 + nb, n)
+            w = k1 - k0
+            # Диагональный блок: этап t вращает строки (j-1, j), j = w - 1 - t + 2i, обнуляя столбец i
+            S = R[k0:k1, k0:k1].copy()
+            Q = np.eye(w, dtype=R.dtype)
+            for t in range(2 * w - 3):
+                i = np.arange(max(0, t - w + 2), min(t // 2, w - 2) + 1)
+                q0 = w - 1 - t + 2 * i[0]
+                rows = slice(q0, q0 + 2 * len(i), 2)
+                _rotate_stage(S, Q, slice(q0 - 1, q0 - 1 + 2 * len(i), 2), rows, i, tol)
+            R[k0:k1, k0:k1] = S
+            R[k0:k1, k1:] = Q @ R[k0:k1, k1:]
+            self.blocks.append((k0, k1, k1, k1, Q))
+
+            for j0 in range(k1, n, nb):
+                j1 = min(j0 + nb, n)
+                h = j1 - j0
+                # Треугольник сверху и блок снизу: на этапе t строка треугольника i
+                # обнуляет элемент (j, i) блока, j = t - i, так что строки этапа не пересекаются
+                S = np.vstack((R[k0:k1, k0:k1], R[j0:j1, k0:k1]))
+                Q = np.eye(w + h, dtype=R.dtype)
+                for t in range(w + h - 1):
+                    i = np.arange(max(0, t - h + 1), min(t, w - 1) + 1)
+                    _rotate_stage(S, Q, slice(i[0], i[-1] + 1), slice(w + t - i[0], w + t - i[-1] - 1, -1), i, tol)
+                R[k0:k1, k0:k1] = S[:w]
+                R[j0:j1, k0:k1] = S[w:]
+                T = Q @ np.vstack((R[k0:k1, k1:], R[j0:j1, k1:]))
+                R[k0:k1, k1:] = T[:w]
+                R[j0:j1, k1:] = T[w:]
+                self.blocks.append((k0, k1, j0, j1, Q))
+
+    def _factor_sequential(self, R, tol):
+        n = self.n
+        for i in range(n - 1):
+            for j in range(i + 1, n):
+                b = R[j, i]
+                if abs(b) <= tol:
+                    continue
+                r = sqrt(R[i, i] ** 2 + b ** 2)
+                c = R[i, i] / r
+                s = b / r
+
+                # Вращение целых отрезков строк i и j
+                top = R[i, i:].copy()
+                R[i, i:] = c * top + s * R[j, i:]
+                R[j, i:] = -s * top + c * R[j, i:]
+                R[j, i] = 0.0
+                self._record(i, j, c, s)
+
+    def _factor_staged(self, R, tol):
+        n = self.n
+        for t in range(2 * n - 3):
+            # На этапе t вращение строк (j-1, j) обнуляет R[j, i], где j = n - 1 - t + 2i,
+            # поэтому строки всех вращений этапа идут с шагом 2 и берутся срезами без копирования
+            i0 = max(0, t - n + 2)
+            cols = np.arange(i0, min(t // 2, n - 2) + 1)
+            q0 = n - 1 - t + 2 * i0
+            rows_q = slice(q0, q0 + 2 * len(cols), 2)
+            rows_p = slice(q0 - 1, q0 - 1 + 2 * len(cols), 2)
+
+            a = R[rows_p][np.arange(len(cols)), cols]
+            b = R[rows_q][np.arange(len(cols)), cols]
+            keep = np.abs(b) > tol
+            if not keep.any():
                 continue
-
-            r = sqrt(A[i][i] ** 2 + A[j][i] ** 2)
-            c = A[i][i] / r
-            s = A[j][i] / r
-
-            for k in range(i, n):
-                temp_i = A[i][k]
-                temp_j = A[j][k]
-                A[i][k] = c * temp_i + s * temp_j
-                A[j][k] = -s * temp_i + c * temp_j
-
-            temp_f_i = f[i]
-            temp_f_j = f[j]
-            f[i] = c * temp_f_i + s * temp_f_j
-            f[j] = -s * temp_f_i + c * temp_f_j
-
-    x = [0.0] * n
-    for i in range(n - 1, -1, -1):
-        s = f[i]
-        for j in range(i + 1, n):
-            s -= A[i][j] * x[j]
-        x[i] = s / A[i][i]
-
-    return x
-
-
-def method_minimal_residuals(A, f, x0, eps):
-    n = len(A)
-    x_prev = x0.copy()
+            r = np.where(keep, np.hypot(a, b), 1.0)
+            c = np.where(keep, a / r, 1.0)[:, None]
+            s = np.where(keep, b / r, 0.0)[:, None]
+
+            top = R[rows_p, i0:]
+            bottom = R[rows_q, i0:]
+            new_top = c * top + s * bottom
+            bottom *= c
+            bottom -= s * top
+            top[...] = new_top
+            R[rows_q][np.arange(len(cols)), cols] = 0.0
+
+            q = np.arange(q0, q0 + 2 * len(cols), 2)
+            self._record(q[keep] - 1, q[keep], c[keep, 0], s[keep, 0])
+
+    def apply_qt(self, b):
+        """Вычисление Q^T b для вектора или матрицы правых частей"""
+        b = np.asarray(b, dtype=self.R.dtype)
+        Y = b.reshape(self.n, -1).copy()
+        if self.block_size is not None:
+            for k0, k1, j0, j1, Q in self.blocks:
+                T = Q @ np.vstack((Y[k0:k1], Y[j0:j1]))
+                Y[k0:k1] = T[:k1 - k0]
+                Y[j0:j1] = T[k1 - k0:]
+        elif self.staged:
+            for k0, k1 in zip(self.stages[:-1], self.stages[1:]):
+                p, q = self.p[k0:k1], self.q[k0:k1]
+                c, s = self.c[k0:k1, None], self.s[k0:k1, None]
+                top, bottom = Y[p], Y[q]
+                Y[p] = c * top + s * bottom
+                Y[q] = -s * top + c * bottom
+        elif Y.shape[1] == 1:
+            # Один столбец: скалярный цикл по вращениям дешевле, чем вызовы numpy
+            y = Y[:, 0].tolist()
+            for p, q, c, s in zip(self.p.tolist(), self.q.tolist(), self.c.tolist(), self.s.tolist()):
+                y[p], y[q] = c * y[p] + s * y[q], -s * y[p] + c * y[q]
+            Y[:, 0] = y
+        else:
+            for p, q, c, s in zip(self.p.tolist(), self.q.tolist(), self.c.tolist(), self.s.tolist()):
+                top = Y[p].copy()
+                Y[p] = c * top + s * Y[q]
+                Y[q] = -s * top + c * Y[q]
+        return Y.reshape(b.shape)
+
+    def solve(self, b):
+        """Решение A x = b: x = R^-1 Q^T b"""
+        Y = self.apply_qt(b)
+        R = self.R
+        for i in range(self.n - 1, -1, -1):
+            Y[i] = (Y[i] - R[i, i + 1:] @ Y[i + 1:]) / R[i, i]
+        return Y
+
+
+def method_rotations(A, f, staged=False, mixed_precision=False, block_size=ROTATION_BLOCK_SIZE):
+    if mixed_precision:
+        # Вращения в float32, невязка и поправки — в float64
+        factor = partial(GivensQR, staged=staged, block_size=block_size)
+        return mixed_precision_solve(A, f, factor=factor)["x"].tolist()
+    return GivensQR(A, staged=staged, block_size=block_size).solve(f).tolist()
+
+
+def _minimal_residuals_loop(matvec, f, x, eps, max_iter, log):
+    # Невязка обновляется рекуррентно r <- r - tau A r: одно умножение на матрицу за итерацию
+    r = matvec(x) - f
+    matvecs = 1
     k = 0
-
     while True:
-        # Вычисляем невязку
-        r_prev = residual(A, x_prev, f)
-
-        # Вычисляем A * r_prev
-        A_r = [0.0] * n
-        for i in range(n):
-            s = 0.0
-            for j in range(n):
-                s += A[i][j] * r_prev[j]
-            A_r[i] = s
+        A_r = matvec(r)
+        matvecs += 1
 
         # Вычисляем оптимальный параметр τ
-        numerator = scalar_product(r_prev, A_r)
-        denominator = scalar_product(A_r, A_r)
+        numerator = r @ A_r
+        denominator = A_r @ A_r
 
         if abs(denominator) < eps:
             break
 
         tau = numerator / denominator
 
-        # Новая итерация
-        x_new = [x_prev[i] - tau * r_prev[i] for i in range(n)]
+        # Новая итерация; ||x_new - x_prev|| = |tau| ||r||
+        norm_diff = abs(tau) * np.linalg.norm(r)
+        x -= tau * r
+        r -= tau * A_r
+        if log is not None:
+            log.append(x, np.linalg.norm(r))
 
         # Проверка условия остановки
-        diff = [x_new[i] - x_prev[i] for i in range(n)]
-        norm_diff = sqrt(sum(x_i ** 2 for x_i in diff))
-
         if norm_diff < eps:
             break
 
-        x_prev = x_new.copy()
         k += 1
 
         # Защита от бесконечного цикла
-        if k > 10000:
+        if k > max_iter:
             break
 
-    return x_new, k
+    return x, k, matvecs
 
 
-def gauss(A, f):
+def _gmres_loop(matvec, f, x, eps, restart, max_iter, log):
+    # GMRES(m): ортонормированный базис Крылова по Арнольди, МНК-задача с матрицей Хессенберга
+    # решается вращениями Гивенса, что даёт норму невязки |g[j + 1]| без вычисления x
+    n = len(f)
+    k = 0
+    matvecs = 0
+    while k < max_iter:
+        r = f - matvec(x)
+        matvecs += 1
+        beta = np.linalg.norm(r)
+        if beta < eps:
+            break
+
+        m = min(restart, max_iter - k)
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs = np.zeros(m)
+        sn = np.zeros(m)
+        g = np.zeros(m + 1)
+        V[0] = r / beta
+        g[0] = beta
+
+        for j in range(m):
+            w = matvec(V[j])
+            matvecs += 1
+            # Классический Грам — Шмидт с повторной ортогонализацией
+            h = V[:j + 1] @ w
+            w -= h @ V[:j + 1]
+            h2 = V[:j + 1] @ w
+            w -= h2 @ V[:j + 1]
+            H[:j + 1, j] = h + h2
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 0:
+                V[j + 1] = w / H[j + 1, j]
+
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            rho = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / rho, H[j + 1, j] / rho
+            H[j, j], H[j + 1, j] = rho, 0.0
+            g[j], g[j + 1] = cs[j] * g[j], -sn[j] * g[j]
+
+            k += 1
+            if log is not None:
+                # Итерат внутри цикла не формируется, известна только норма невязки
+                log.append(None, abs(g[j + 1]))
+            if abs(g[j + 1]) < eps or sn[j] == 1.0:
+                break
+
+        size = j + 1
+        y = np.linalg.solve(np.triu(H[:size, :size]), g[:size])
+        x += y @ V[:size]
+        if abs(g[size]) < eps:
+            break
+
+    return x, k, matvecs
+
+
+def minimal_residuals(A, f, x0, eps, mode="mr", restart=30, max_iter=10000, log=None):
+    """Итерационное решение A x = f; A — плотная, scipy.sparse или LinearOperator.
+
+    mode="mr" — метод минимальных невязок (остановка по ||x_k+1 - x_k|| < eps),
+    mode="gmres" — GMRES(restart) (остановка по ||A x - f|| < eps).
+    log — IterationLog (размерности n или 0) для итератов и норм невязки по итерациям.
+    """
+    matvec, n = as_operator(A)
+    f = np.asarray(f, dtype=float)
+    x = np.array(x0, dtype=float)
+
+    start = perf_counter()
+    if mode == "mr":
+        x, k, matvecs = _minimal_residuals_loop(matvec, f, x, eps, max_iter, log)
+    elif mode == "gmres":
+        x, k, matvecs = _gmres_loop(matvec, f, x, eps, restart, max_iter, log)
+    else:
+        raise ValueError(f"Неизвестный режим: {mode}")
+    elapsed = perf_counter() - start
+
+    return {
+        "x": x,
+        "iterations": k,
+        "matvecs": matvecs,
+        "time": elapsed,
+        "residual": float(np.linalg.norm(matvec(x) - f)),
+    }
+
+
+def method_minimal_residuals(A, f, x0, eps, log=None):
+    result = minimal_residuals(A, f, x0, eps, log=log)
+    return result["x"].tolist(), result["iterations"]
+
+
+def gauss(A, f, mixed_precision=False):
+    if mixed_precision:
+        return mixed_precision_solve(A, f)["x"].tolist()
     n = len(f)
     for i in range(n):
         max_row = i
@@ -150,18 +397,10 @@ def gauss(A, f):
     return x
 
 
-def inverse(A):
-    n = len(A)
-    inv = [[0] * n for _ in range(n)]
-
-    for i in range(n):
-        e = [0] * n
-        e[i] = 1
-        col = gauss([row[:] for row in A], e)
-        for j in range(n):
-            inv[j][i] = col[j]
-
-    return inv
+def inverse(A, lu=None):
+    # Одно LU-разложение на все столбцы единичной матрицы
+    lu = lu or LUFactorization(A)
+    return lu.inverse().tolist()
 
 
 def residual(A, x, f):
@@ -175,14 +414,34 @@ def residual(A, x, f):
     return r
 
 
-def condition_number(A):
+# До этого размера число обусловленности по умолчанию считается точно, через A^-1
+EXACT_CONDITION_MAX_N = 500
+
+
+def condition_number(A, lu=None, method="auto"):
+    """Число обусловленности в 1-норме: "exact" — через A^-1, "estimate" — оценка Хейгера — Хайэма"""
+    lu = lu or LUFactorization(A)
+    if method == "auto":
+        method = "exact" if lu.n <= EXACT_CONDITION_MAX_N else "estimate"
     norm_A = mn(A)
-    A_inv = inverse(A)
-    norm_A_inv = mn(A_inv)
+    if method == "exact":
+        norm_A_inv = mn(lu.inverse())
+    elif method == "estimate":
+        norm_A_inv = lu.inverse_norm1_estimate()
+    else:
+        raise ValueError(f"Неизвестный способ: {method}")
     M_A = norm_A * norm_A_inv
     return M_A
 
 
+def condition_number_discrepancy(A, lu=None):
+    """Точное значение, оценка и относительное расхождение между ними (на одном разложении)"""
+    lu = lu or LUFactorization(A)
+    exact = condition_number(A, lu, method="exact")
+    estimate = condition_number(A, lu, method="estimate")
+    return exact, estimate, abs(exact - estimate) / exact
+
+
 def main(printer):
     A = [
         [12.00, -3.00, -1.00, 3.00],
@@ -217,11 +476,17 @@ def main(printer):
     printer.first_order_matrix(x2, '\nx')
     printer.residual(r2)
     print(f"Метод сошелся за {k2} итераций(ю)")
+
+    for mode in ("mr", "gmres"):
+        result = minimal_residuals(A, b, x0, eps, mode=mode)
+        print(f"{mode}: итераций {result['iterations']}, умножений на матрицу {result['matvecs']}, "
+              f"время {result['time'] * 1e3:.3f} мс, ||Ax - b|| = {result['residual']:.2e}")
     print('-' * 60)
 
-    M_A = condition_number(A)
+    M_A, M_est, discrepancy = condition_number_discrepancy(A)
     print(f"\nЧисло обусловленности (numpy): {np.linalg.cond(A, 1):.4f}")
     print(f"Число обусловленности (наше вычисление): M = {M_A:.4f}")
+    print(f"Оценка Хейгера — Хайэма: M ≈ {M_est:.4f} (расхождение {discrepancy:.2e})")
 
 
 if __name__ == '__main__':
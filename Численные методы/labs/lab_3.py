@@ -1,44 +1,24 @@
 import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from time import perf_counter
+
 import numpy as np
 
+from iteration_log import IterationLog
+from lu import LUFactorization
+
 
 def determinant(matrix):
-    n = len(matrix)
-    if n == 1:
-        return matrix[0][0]
-    if n == 2:
-        return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
-    det = 0.0
-    for j in range(n):
-        minor = [[matrix[i][k] for k in range(n) if k != j] for i in range(1, n)]
-        det += ((-1) ** j) * matrix[0][j] * determinant(minor)
-    return det
+    # LU-разложение вместо разложения по строке: O(n^3) вместо O(n!)
+    return LUFactorization(matrix).det()
 
 
 def inverse_matrix(matrix):
-    M = [[float(x) for x in row] for row in matrix]
-    n = len(M)
-    det = determinant(M)
-    if abs(det) < 1e-14:
+    lu = LUFactorization(matrix)
+    if lu.singular or abs(lu.det()) < 1e-14:
         raise ValueError("Матрица вырождена")
-
-    adj = [[0.0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(n):
-            minor = []
-            for ii in range(n):
-                if ii == i:
-                    continue
-                row = []
-                for jj in range(n):
-                    if jj == j:
-                        continue
-                    row.append(M[ii][jj])
-                minor.append(row)
-            cofactor = ((-1) ** (i + j)) * determinant(minor)
-            adj[j][i] = cofactor
-
-    return [[adj[i][j] / det for j in range(n)] for i in range(n)]
+    return lu.inverse().tolist()
 
 
 def F_vec(x):
@@ -77,7 +57,7 @@ def norm(v):
 # =============================
 # Метод Зейделя
 # =============================
-def seidel_method(x0, eps=1e-3, max_iter=500):
+def seidel_method(x0, eps=1e-3, max_iter=500, log=None):
     x, y, z = x0
 
     # Проверка достаточного условия сходимости
@@ -93,72 +73,212 @@ def seidel_method(x0, eps=1e-3, max_iter=500):
     else:
         print(f"Достаточное условие сходимости выполнено {max_norm:.4f}")
 
-    history = []
-    for k in range(max_iter):
+    iterations = 0
+    for _ in range(max_iter):
         x_old, y_old, z_old = x, y, z
         x = 0.1 - x_old * x_old + 2 * y_old * z_old
         y = -0.2 + y_old * y_old - 3 * x * z_old
         z = 0.3 - z_old * z_old - 2 * x * y
-        Fx = F_vec([x, y, z])
-        res = norm(Fx)
-        history.append((k, [x, y, z], Fx, res))
+        iterations += 1
+        if log is not None:
+            Fx = F_vec([x, y, z])
+            log.append([x, y, z], norm(Fx), Fx)
 
         delta = max(abs(x - x_old), abs(y - y_old), abs(z - z_old))
         if delta < eps:
             break
 
-    return [x, y, z], history
+    return [x, y, z], iterations
 
 
 # =============================
 # Метод Ньютона
 # =============================
-def matrix_vector_mul(A, v):
-    return [sum(A[i][j] * v[j] for j in range(3)) for i in range(3)]
+def finite_difference_jacobian(F, x, Fx=None):
+    """Якобиан правыми разностями: n дополнительных вычислений F"""
+    x = np.asarray(x, dtype=float)
+    Fx = np.asarray(F(x), dtype=float) if Fx is None else Fx
+    J = np.empty((Fx.size, x.size))
+    for j in range(x.size):
+        h = math.sqrt(np.finfo(float).eps) * max(1.0, abs(x[j]))
+        xh = x.copy()
+        xh[j] += h
+        J[:, j] = (np.asarray(F(xh), dtype=float) - Fx) / h
+    return J
+
+
+def newton(F, J, x0, eps_x=1e-6, max_iter=50, reuse=1, log=None):
+    """Метод Ньютона для F(x) = 0 в R^n: J(x) dx = F(x) решается через LU, без обращения J.
+
+    J=None — якобиан конечными разностями. reuse > 1 — метод Шаманского: одно LU-разложение
+    используется reuse шагов подряд (reuse >= max_iter — метод хорд).
+    log — IterationLog, в который пишутся x, ||F(x)|| и F(x) каждой итерации.
+    """
+    x = np.array(x0, dtype=float)
+    lu = None
+    factorizations = 0
+    converged = False
+    iterations = 0
+    start = perf_counter()
 
+    for k in range(max_iter):
+        Fv = np.asarray(F(x), dtype=float)
+        if k % reuse == 0:
+            Jx = finite_difference_jacobian(F, x, Fv) if J is None else np.asarray(J(x), dtype=float)
+            lu = LUFactorization(Jx)
+            factorizations += 1
+        try:
+            dx = lu.solve(Fv)
+        except ValueError:
+            print(f"Вырожденная матрица Якоби на итерации {k}")
+            break
 
-def vector_sub(a, b):
-    return [a[i] - b[i] for i in range(3)]
+        # В журнал и счётчик попадают только выполненные шаги
+        if log is not None:
+            log.append(x, np.linalg.norm(Fv), Fv)
+        iterations += 1
+        x = x - dx
+        if np.max(np.abs(dx)) < eps_x:
+            converged = True
+            break
 
+    return {
+        "x": x,
+        "iterations": iterations,
+        "factorizations": factorizations,
+        "converged": converged,
+        "time": perf_counter() - start,
+        "lu": lu,
+    }
 
-def newton_method(x0, eps_x=1e-6, max_iter=50):
-    x = x0[:]
-    hist = []
-    last_invJ = None
 
-    for k in range(max_iter):
-        x_old = x[:]
-        Fv = F_vec(x)
-        F_norm = norm(Fv)
-        J = J_mat(x)
-        try:
-            invJ = inverse_matrix(J)
-        except:
-            print(f"Ошибка обращения матрицы на итерации {k}")
+def newton_method(x0, eps_x=1e-6, max_iter=50, log=None):
+    result = newton(F_vec, J_mat, x0, eps_x, max_iter, log=log)
+    lu = result["lu"]
+    last_invJ = lu.inverse().tolist() if lu is not None and not lu.singular else None
+    return result["x"].tolist(), result["iterations"], last_invJ
+
+
+# =============================
+# Пакетный запуск из многих начальных точек
+# =============================
+def F_batch(X):
+    """F_vec для K точек сразу: X формы (K, 3)"""
+    xv, yv, zv = X[:, 0], X[:, 1], X[:, 2]
+    return np.stack([
+        xv + xv * xv - 2 * yv * zv - 0.1,
+        yv - yv * yv + 3 * xv * zv + 0.2,
+        zv + zv * zv + 2 * xv * yv - 0.3,
+    ], axis=1)
+
+
+def J_batch(X):
+    """J_mat для K точек сразу: результат формы (K, 3, 3)"""
+    xv, yv, zv = X[:, 0], X[:, 1], X[:, 2]
+    return np.stack([
+        np.stack([1 + 2 * xv, -2 * zv, -2 * yv], axis=1),
+        np.stack([3 * zv, 1 - 2 * yv, 3 * xv], axis=1),
+        np.stack([2 * yv, 2 * xv, 1 + 2 * zv], axis=1),
+    ], axis=1)
+
+
+def solve_batched(J, F):
+    """Решение K систем J[k] dx = F[k]; для вырожденных J результат — nan"""
+    singular = ~(np.abs(np.linalg.det(J)) > 0)
+    if singular.any():
+        J = J.copy()
+        J[singular] = np.eye(J.shape[-1])
+    dX = np.linalg.solve(J, F[..., None])[..., 0]
+    dX[singular] = np.nan
+    return dX
+
+
+def newton_batch(F, J, X0, eps_x=1e-6, max_iter=50):
+    """Метод Ньютона для K начальных точек одновременно: X0 формы (K, n).
+
+    F и J принимают массив (M, n) и возвращают (M, n) и (M, n, n). На каждой итерации
+    обрабатываются только ещё не сошедшиеся и не разошедшиеся траектории.
+    """
+    X = np.array(X0, dtype=float)
+    iterations = np.zeros(len(X), dtype=int)
+    converged = np.zeros(len(X), dtype=bool)
+    active = np.arange(len(X))
+
+    for _ in range(max_iter):
+        if not active.size:
             break
+        Xa = X[active]
+        dX = solve_batched(J(Xa), F(Xa))
+        X[active] = Xa - dX
+        iterations[active] += 1
+
+        with np.errstate(invalid="ignore"):
+            done = np.max(np.abs(dX), axis=1) < eps_x
+        failed = ~np.isfinite(X[active]).all(axis=1)
+        converged[active[done]] = True
+        active = active[~(done | failed)]
 
-        last_invJ = invJ
-        hist.append((k, x[:], Fv[:], F_norm))
+    return {"x": X, "converged": converged, "iterations": iterations}
 
-        dx = matrix_vector_mul(invJ, Fv)
-        x = vector_sub(x, dx)
 
-        delta = max(abs(x[i] - x_old[i]) for i in range(3))
-        if delta < eps_x:
+def seidel_batch(X0, eps=1e-3, max_iter=500):
+    """Метод Зейделя из seidel_method для K начальных точек одновременно"""
+    X = np.array(X0, dtype=float)
+    iterations = np.zeros(len(X), dtype=int)
+    converged = np.zeros(len(X), dtype=bool)
+    active = np.arange(len(X))
+
+    for _ in range(max_iter):
+        if not active.size:
             break
+        x_old, y_old, z_old = X[active].T
+        x = 0.1 - x_old * x_old + 2 * y_old * z_old
+        y = -0.2 + y_old * y_old - 3 * x * z_old
+        z = 0.3 - z_old * z_old - 2 * x * y
+        X[active] = np.stack([x, y, z], axis=1)
+        iterations[active] += 1
+
+        with np.errstate(invalid="ignore"):
+            delta = np.maximum.reduce([np.abs(x - x_old), np.abs(y - y_old), np.abs(z - z_old)])
+            done = delta < eps
+        failed = ~np.isfinite(X[active]).all(axis=1)
+        converged[active[done]] = True
+        active = active[~(done | failed)]
 
-    return x, hist, last_invJ
+    return {"x": X, "converged": converged, "iterations": iterations}
+
+
+def _newton_task(F, J, eps_x, max_iter, x0):
+    result = newton(F, J, x0, eps_x, max_iter)
+    return result["x"], result["converged"], result["iterations"]
+
+
+def newton_pool(F, J, X0, eps_x=1e-6, max_iter=50, processes=None, chunksize=256):
+    """Метод Ньютона из многих начальных точек в пуле процессов.
+
+    Для F и J, которые нельзя векторизовать: они вызываются по одной точке, поэтому должны
+    быть функциями уровня модуля (передаются в процессы через pickle).
+    """
+    task = partial(_newton_task, F, J, eps_x, max_iter)
+    with ProcessPoolExecutor(processes) as pool:
+        results = list(pool.map(task, np.asarray(X0, dtype=float), chunksize=chunksize))
+    return {
+        "x": np.array([r[0] for r in results]),
+        "converged": np.array([r[1] for r in results]),
+        "iterations": np.array([r[2] for r in results]),
+    }
 
 
 if __name__ == "__main__":
     x0 = [0.1, -0.1, 0.1]
 
     # --- Метод Зейделя ---
-    x_seid, hist_seid = seidel_method(x0)
-    kS, xS, F_seid_vec, resS = hist_seid[-1]
+    log_seid = IterationLog(3, value_dim=3)
+    x_seid, kS = seidel_method(x0, log=log_seid)
+    F_seid_vec, resS = log_seid.values[-1], log_seid.residuals[-1]
 
     print("Метод Зейделя")
-    print("Количество итераций =", kS + 1)
+    print("Количество итераций =", kS)
     print("x:")
     for v in x_seid:
         print(f"{v:.4f}")
@@ -170,11 +290,12 @@ if __name__ == "__main__":
     print()
 
     # --- Метод Ньютона ---
-    x_newt, hist_newt, last_inv = newton_method(x_seid)
-    kN, xN, F_newt_vec, resN = hist_newt[-1]
+    log_newt = IterationLog(3, value_dim=3)
+    x_newt, kN, last_inv = newton_method(x_seid, log=log_newt)
+    F_newt_vec, resN = log_newt.values[-1], log_newt.residuals[-1]
 
     print("Метод Ньютона")
-    print("Количество итераций =", len(hist_newt))
+    print("Количество итераций =", kN)
     print("x:")
     for v in x_newt:
         print(f"{v:.4f}")
@@ -198,3 +319,12 @@ if __name__ == "__main__":
     for val in F_np:
         print(f"{val:.16f}")
     print(f'Норма = {np.linalg.norm(F_np):.16f}')
+
+    # --- Поиск корней из многих начальных точек ---
+    starts = np.random.default_rng(0).uniform(-2.0, 2.0, size=(100_000, 3))
+    batch = newton_batch(F_batch, J_batch, starts)
+    roots = np.unique(np.round(batch["x"][batch["converged"]], 4), axis=0)
+    print(f"\nМетод Ньютона из {len(starts)} начальных точек: сошлись {batch['converged'].sum()}")
+    print("Найденные корни:")
+    for root in roots:
+        print("  ".join(f"{val:.4f}" for val in root))
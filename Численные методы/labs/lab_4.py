@@ -1,22 +1,20 @@
 import math
+from time import perf_counter
 
+import numpy as np
 
-def mat_copy(A):
-    return [row[:] for row in A]
+from hessenberg import hessenberg, la_budde_charpoly
+from lu import BatchedLUFactorization, LUFactorization
+from matrix_kernels import matmul
+from operators import as_operator
+from polynomial import Polynomial
+from refinement import mixed_precision_solve
+from roots import real_roots
+from symmetric_eigen import EPS, apply_reflectors, eigh, tridiagonal_inverse_iteration, tridiagonalize
 
 
 def mat_mul(A, B):
-    n = len(A)
-    m = len(B[0])
-    p = len(B)
-    C = [[0.0] * m for _ in range(n)]
-    for i in range(n):
-        for j in range(m):
-            s = 0.0
-            for k in range(p):
-                s += A[i][k] * B[k][j]
-            C[i][j] = s
-    return C
+    return matmul(A, B)
 
 
 def mat_vec_mul(A, v):
@@ -31,7 +29,10 @@ def norm2(v):
     return math.sqrt(sum(x * x for x in v))
 
 
-def gauss_solve(A, b):
+def gauss_solve(A, b, mixed_precision=False):
+    if mixed_precision:
+        # LU в float32 с уточнением по невязке в float64 вместо исключения в списках
+        return mixed_precision_solve(A, b)["x"].tolist()
     n = len(A)
     M = [[float(A[i][j]) for j in range(n)] + [float(b[i])] for i in range(n)]
     for k in range(n):
@@ -53,42 +54,16 @@ def gauss_solve(A, b):
     return [M[i][n] for i in range(n)]
 
 
-def determinant(M):
-    n = len(M)
-    if n == 1:
-        return M[0][0]
-    if n == 2:
-        return M[0][0] * M[1][1] - M[0][1] * M[1][0]
-    det = 0.0
-    for j in range(n):
-        minor = [[M[i][k] for k in range(n) if k != j] for i in range(1, n)]
-        det += ((-1) ** j) * M[0][j] * determinant(minor)
-    return det
+def determinant(matrix):
+    # LU-разложение вместо разложения по строке: O(n^3) вместо O(n!)
+    return LUFactorization(matrix).det()
 
 
 def inverse_matrix(matrix):
-    M = [[float(x) for x in row] for row in matrix]
-    n = len(M)
-    det = determinant(M)
-    if abs(det) < 1e-14:
+    lu = LUFactorization(matrix)
+    if lu.singular or abs(lu.det()) < 1e-14:
         raise ValueError("Матрица вырождена")
-
-    adj = [[0.0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(n):
-            minor = []
-            for ii in range(n):
-                if ii == i:
-                    continue
-                row = []
-                for jj in range(n):
-                    if jj == j:
-                        continue
-                    row.append(M[ii][jj])
-                minor.append(row)
-            cofactor = ((-1) ** (i + j)) * determinant(minor)
-            adj[j][i] = cofactor
-    return [[adj[i][j] / det for j in range(n)] for i in range(n)]
+    return lu.inverse().tolist()
 
 
 def fmt(x):
@@ -113,60 +88,6 @@ def print_matrix_A_original():
         print("  " + "  ".join(row))
 
 
-# полиномы: представление коэффициентами
-def poly_add(p, q):
-    m = max(len(p), len(q))
-    r = [0.0] * m
-    for i in range(m):
-        if i < len(p):
-            r[i] += p[i]
-        if i < len(q):
-            r[i] += q[i]
-    return r
-
-
-def poly_sub(p, q):
-    m = max(len(p), len(q))
-    r = [0.0] * m
-    for i in range(m):
-        if i < len(p):
-            r[i] += p[i]
-        if i < len(q):
-            r[i] -= q[i]
-    return r
-
-
-def poly_mul_scalar(p, a):
-    return [a * ci for ci in p]
-
-
-def poly_eval_asc(p, x):
-    s = 0.0
-    xp = 1.0
-    for c in p:
-        s += c * xp
-        xp *= x
-    return s
-
-
-def poly_compose_linear_t_to_x(coeffs_t, alpha, beta):
-    res = [0.0]
-    power = [1.0]
-    base = [beta, alpha]
-    for j in range(len(coeffs_t)):
-        res = poly_add(res, poly_mul_scalar(power, coeffs_t[j]))
-        power = poly_mul(power, base)
-    return res
-
-
-def poly_mul(p, q):
-    r = [0.0] * (len(p) + len(q) - 1)
-    for i in range(len(p)):
-        for j in range(len(q)):
-            r[i + j] += p[i] * q[j]
-    return r
-
-
 def prepare_data_N_equals_11():
     N = 11
     base_xs = [0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2]
@@ -188,66 +109,111 @@ def prepare_data_N_equals_11():
 
 
 # дискретные ортогональные чебышевы полиномы
-def build_discrete_orthogonal_polynomials(t_nodes, deg=3):
-    def inner(p, q):
-        s = 0.0
-        for ti in t_nodes:
-            s += poly_eval_asc(p, ti) * poly_eval_asc(q, ti)
-        return s
-
-    basis = []
-    for k in range(deg + 1):
-        p = [0.0] * k + [1.0]
-        basis.append(p)
-
-    T = []
-    for k in range(deg + 1):
-        q = basis[k][:]
-        for j in range(k):
-            denom = inner(T[j], T[j])
-            if abs(denom) < 1e-14:
+class DiscreteOrthogonalBasis:
+    """Монические многочлены, ортогональные на узлах t_nodes, по трёхчленной рекуррентности Стилтьеса:
+
+        p_{k+1}(t) = (t - a_k) p_k(t) - b_k p_{k-1}(t),
+        a_k = (t p_k, p_k) / (p_k, p_k),  b_k = (p_k, p_k) / (p_{k-1}, p_{k-1}).
+
+    Значения p_k строятся сразу в узлах как массивы, без коэффициентов в степенной базе:
+    построение и подгонка стоят O(deg N), в памяти одновременно три массива длины N.
+    """
+
+    def __init__(self, t_nodes, deg=3):
+        t = np.asarray(t_nodes, dtype=float)
+        if deg >= len(np.unique(t)):
+            raise ValueError("Степень должна быть меньше числа различных узлов")
+        self.t_nodes = t
+        self.deg = deg
+        self.a = np.empty(deg + 1)
+        self.b = np.zeros(deg + 1)
+        self.norms = np.empty(deg + 1)
+
+        p_prev = np.zeros_like(t)
+        p = np.ones_like(t)
+        for k in range(deg + 1):
+            norm = float(p @ p)
+            if norm == 0.0:
                 raise ValueError("Нулевая норма при построении ортогональных полиномов")
-            num = inner(q, T[j])
-            q = poly_sub(q, poly_mul_scalar(T[j], num / denom))
-        T.append(q)
-    return T
+            self.norms[k] = norm
+            self.a[k] = float((t * p) @ p) / norm
+            if k:
+                self.b[k] = norm / self.norms[k - 1]
+            if k < deg:
+                p, p_prev = (t - self.a[k]) * p - self.b[k] * p_prev, p
+
+    def iter_values(self, t):
+        """Значения p_0(t), ..., p_deg(t) по очереди; t — скаляр или массив точек"""
+        t = np.asarray(t, dtype=float)
+        p_prev = np.zeros_like(t)
+        p = np.ones_like(t)
+        for k in range(self.deg + 1):
+            yield p
+            p, p_prev = (t - self.a[k]) * p - self.b[k] * p_prev, p
+
+    def fit(self, ys) -> np.ndarray:
+        """Коэффициенты c_k = (y, p_k) / (p_k, p_k) наилучшего приближения в узлах"""
+        ys = np.asarray(ys, dtype=float)
+        ck = np.empty(self.deg + 1)
+        for k, pk in enumerate(self.iter_values(self.t_nodes)):
+            ck[k] = float(ys @ pk) / self.norms[k]
+        return ck
+
+    def evaluate(self, ck, t):
+        """Сумма sum c_k p_k(t) по схеме Кленшоу — без перехода к степенной базе"""
+        t = np.asarray(t, dtype=float)
+        u1 = np.zeros_like(t)
+        u2 = np.zeros_like(t)
+        for k in range(self.deg, -1, -1):
+            b_next = self.b[k + 1] if k < self.deg else 0.0
+            u1, u2 = ck[k] + (t - self.a[k]) * u1 - b_next * u2, u1
+        return u1
+
+    def polynomials(self):
+        """Многочлены p_k в степенной базе; при большой степени коэффициенты теряют точность"""
+        T = [Polynomial([1.0])]
+        prev = Polynomial([0.0])
+        for k in range(self.deg):
+            T.append(T[k] * Polynomial([-self.a[k], 1.0]) - prev * self.b[k])
+            prev = T[k]
+        return T
+
+
+def build_discrete_orthogonal_polynomials(t_nodes, deg=3):
+    return DiscreteOrthogonalBasis(t_nodes, deg=deg).polynomials()
+
 
+def least_squares_discrete_chebyshev(xs, ys, deg=3, power_basis=True):
+    """МНК-приближение степени deg по узлам, отображённым на [-1, 1].
 
-def least_squares_discrete_chebyshev(xs, ys, deg=3):
+    При power_basis=False степенная форма (Tpolys, P_t, P_x) не строится: для больших степеней
+    значения приближения берутся через res["basis"].evaluate(res["ck"], alpha * x + beta).
+    """
     a = xs[0]
     b = xs[-1]
     alpha = 2.0 / (b - a)
     beta = -(a + b) / (b - a)
 
-    def to_t(x):
-        return alpha * x + beta
+    t_nodes = alpha * np.asarray(xs, dtype=float) + beta
+    basis = DiscreteOrthogonalBasis(t_nodes, deg=deg)
+    ck = basis.fit(ys)
 
-    t_nodes = [to_t(x) for x in xs]
-    Tpolys = build_discrete_orthogonal_polynomials(t_nodes, deg=deg)
-
-    ck = []
-    for k in range(deg + 1):
-        num = 0.0
-        den = 0.0
-        for i in range(len(xs)):
-            Tk = poly_eval_asc(Tpolys[k], t_nodes[i])
-            num += ys[i] * Tk
-            den += Tk * Tk
-        if abs(den) < 1e-14:
-            raise ValueError("Нулевая норма Tk при вычислении коэффициентов")
-        ck.append(num / den)
-
-    P_t = [0.0]
-    for k in range(deg + 1):
-        P_t = poly_add(P_t, poly_mul_scalar(Tpolys[k], ck[k]))
-
-    P_x = poly_compose_linear_t_to_x(P_t, alpha, beta)
+    Tpolys = P_t = P_x = None
+    if power_basis:
+        Tpolys = basis.polynomials()
+        P_t = Polynomial([0.0])
+        for k in range(deg + 1):
+            P_t = P_t + Tpolys[k] * ck[k]
+        P_x = P_t.compose_linear(alpha, beta)
 
     h = xs[1] - xs[0]
     return {
-        "t_nodes": t_nodes,
+        "t_nodes": t_nodes.tolist(),
+        "basis": basis,
+        "alpha": alpha,
+        "beta": beta,
         "Tpolys": Tpolys,
-        "ck": ck,
+        "ck": ck.tolist(),
         "P_t": P_t,
         "P_x": P_x,
         "h": h,
@@ -255,15 +221,6 @@ def least_squares_discrete_chebyshev(xs, ys, deg=3):
 
 
 # Данилевский
-def swap_rows_cols(M, i, j):
-    n = len(M)
-    B = [row[:] for row in M]
-    B[i], B[j] = B[j], B[i]
-    for r in range(n):
-        B[r][i], B[r][j] = B[r][j], B[r][i]
-    return B
-
-
 def frobenius_type(F, tol=1e-8):
     n = len(F)
     superdiag = all(abs(F[i][i + 1] - 1.0) < tol for i in range(n - 1))
@@ -299,7 +256,13 @@ def leverrier_charpoly(A):
     return coeffs
 
 
-def charpoly_from_frobenius(F):
+def charpoly_from_frobenius(F, fallback="hessenberg"):
+    """Коэффициенты [1, c1, ..., cn] по строке формы Фробениуса.
+
+    Если F не фробениусова, коэффициенты считаются запасным методом: fallback="hessenberg" —
+    приведение к форме Хессенберга и рекуррентность Ла Будде (O(n^3)),
+    fallback="leverrier" — метод Леверрье (n матричных произведений).
+    """
     n = len(F)
     t = frobenius_type(F)
     if t == "super":
@@ -310,50 +273,59 @@ def charpoly_from_frobenius(F):
         first = F[0]
         c1_to_cn = [-first[j] for j in range(n)]
         return [1.0] + c1_to_cn
-    return leverrier_charpoly(F)
+    if fallback == "leverrier":
+        return leverrier_charpoly(F)
+    if fallback != "hessenberg":
+        raise ValueError(f"Неизвестный метод: {fallback}")
+    return la_budde_charpoly(hessenberg(F))
+
 
+def danilevski_step(M, r, s):
+    """Преобразование подобия P^-1 M P на месте, где P — единичная матрица с r-й строкой M[s] / M[s][r].
 
-def danilevski_strict(A):
+    P = I + e_r d^T, d = M[s] / M[s][r] - e_r, d_r = 0, поэтому P^-1 = I - e_r d^T:
+    умножение справа меняет матрицу ранг-1 поправкой, слева — только строку r. Шаг стоит O(n^2).
+    """
+    d = M[s] / M[s, r]
+    d[r] = 0.0
+    M += np.outer(M[:, r], d)
+    M[r] -= d @ M
+
+
+def danilevski_strict(A, fallback="hessenberg"):
+    """Приведение к форме Фробениуса методом Данилевского и характеристический многочлен.
+
+    Если шаг невозможен (нет ненулевого элемента для перестановки), при fallback=None
+    выбрасывается ValueError, иначе коэффициенты считаются по уже частично приведённой
+    (подобной A) матрице методом fallback (см. charpoly_from_frobenius).
+    """
     n = len(A)
-    M = mat_copy(A)
+    M = np.array(A, dtype=float)
     tol = 1e-14
     for p in range(n - 1, 0, -1):
         r = p - 1
         s = p
-        alpha = M[s][r]
+        alpha = M[s, r]
         if abs(alpha) < tol:
-            found = False
-            for i in range(r):
-                if abs(M[s][i]) > tol:
-                    M = swap_rows_cols(M, i, r)
-                    found = True
-                    break
-            if not found:
-                raise ValueError(
-                    "Не удалось найти ненулевой элемент для шага Данилевского"
-                )
-            alpha = M[s][r]
-
-        P = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
-        for j in range(n):
-            P[r][j] = M[s][j] / alpha
+            candidates = np.flatnonzero(np.abs(M[s, :r]) > tol)
+            if not candidates.size:
+                if fallback is None:
+                    raise ValueError(
+                        "Не удалось найти ненулевой элемент для шага Данилевского"
+                    )
+                break
+            i = candidates[0]
+            M[[i, r]] = M[[r, i]]
+            M[:, [i, r]] = M[:, [r, i]]
 
-        P_inv = inverse_matrix(P)
-        M = mat_mul(P_inv, mat_mul(M, P))
+        danilevski_step(M, r, s)
 
-    A_fro = M
-    coeffs = charpoly_from_frobenius(A_fro)
+    A_fro = M.tolist()
+    coeffs = charpoly_from_frobenius(A_fro, fallback=fallback or "hessenberg")
     return A_fro, coeffs
 
 
 # Корни
-def poly_eval_desc(coeffs_desc, x):
-    s = 0.0
-    for a in coeffs_desc:
-        s = s * x + a
-    return s
-
-
 def gershgorin_bound(A):
     n = len(A)
     mx = 0.0
@@ -365,104 +337,66 @@ def gershgorin_bound(A):
     return mx + 1.0
 
 
-def bisection_root(coeffs_desc, a, b, tol=1e-12):
-    fa = poly_eval_desc(coeffs_desc, a)
-    fb = poly_eval_desc(coeffs_desc, b)
-    if fa == 0.0:
-        return a
-    if fb == 0.0:
-        return b
-    for _ in range(200):
-        m = 0.5 * (a + b)
-        fm = poly_eval_desc(coeffs_desc, m)
-        if abs(fm) < tol or abs(b - a) < tol:
-            return m
-        if fa * fm < 0:
-            b = m
-            fb = fm
-        else:
-            a = m
-            fa = fm
-    return 0.5 * (a + b)
-
-
-def find_real_roots_scan(coeffs_desc, bound_R, n_roots=4):
-    for M in [2000, 5000, 10000, 20000]:
-        xs = [-bound_R + (2.0 * bound_R) * i / M for i in range(M + 1)]
-        vals = [poly_eval_desc(coeffs_desc, x) for x in xs]
-        intervals = []
-        for i in range(M):
-            f1 = vals[i]
-            f2 = vals[i + 1]
-            if f1 == 0.0:
-                intervals.append((xs[i] - 1e-6, xs[i] + 1e-6))
-            elif f1 * f2 < 0:
-                intervals.append((xs[i], xs[i + 1]))
-
-        roots = []
-        for a, b in intervals:
-            r = bisection_root(coeffs_desc, a, b, tol=1e-12)
-            ok = True
-            for rr in roots:
-                if abs(r - rr) < 1e-6:
-                    ok = False
-                    break
-            if ok:
-                roots.append(r)
-        roots.sort()
-        if len(roots) >= n_roots:
-            return roots[:n_roots]
-    return roots
-
-
 # Собственные векторы (A - λI) v = 0
-def nullspace_vector(M):
-    n = len(M)
-    A = [row[:] for row in M]
-    row = 0
-    piv_cols = []
-    tol = 1e-10
-
-    for col in range(n):
-        sel = None
-        for r in range(row, n):
-            if abs(A[r][col]) > tol:
-                sel = r
-                break
-        if sel is None:
-            continue
-        A[row], A[sel] = A[sel], A[row]
-        pivot = A[row][col]
-        A[row] = [val / pivot for val in A[row]]
-        for r in range(n):
-            if r != row:
-                fac = A[r][col]
-                if abs(fac) > tol:
-                    A[r] = [A[r][c] - fac * A[row][c] for c in range(n)]
-        piv_cols.append(col)
-        row += 1
-        if row == n:
-            break
-
-    free_cols = [c for c in range(n) if c not in piv_cols]
-    if not free_cols:
-        return [0.0] * n
-
-    free = free_cols[0]
-    v = [0.0] * n
-    v[free] = 1.0
-
-    for r_idx in range(len(piv_cols) - 1, -1, -1):
-        c = piv_cols[r_idx]
-        s = 0.0
-        for j in free_cols:
-            s += A[r_idx][j] * v[j]
-        v[c] = -s
-
-    nrm = norm2(v)
-    if nrm == 0:
-        return v
-    return [vi / nrm for vi in v]
+# Наибольшее число элементов стопки матриц A - λ_j I в одной порции обратных итераций
+INVERSE_ITERATION_ELEMENTS = 1 << 22
+
+
+def inverse_iteration(A, eigenvalues, iterations=2, seed=0):
+    """Собственные векторы обратными итерациями сразу для всех собственных значений.
+
+    Для симметричной A — трёхдиагонализация и обратные итерации с трёхдиагональной
+    матрицей (symmetric_eigen), за O(n^2) на значение. Иначе матрицы A - λ_j I
+    раскладываются стопками (BatchedLUFactorization) порциями не больше
+    INVERSE_ITERATION_ELEMENTS элементов, затем каждая итерация — одно пакетное решение.
+    Почти нулевые ведущие элементы заменяются на eps ||A||, что при точном λ только
+    ускоряет сходимость. Для симметричной A векторы кластеров близких собственных
+    значений ортогонализуются.
+    Возвращает массив векторов по строкам с нормой 1; последняя заметно ненулевая
+    компонента положительна, как у свободной переменной в нуль-пространстве.
+    """
+    A = np.asarray(A, dtype=float)
+    lams = np.asarray(eigenvalues, dtype=float)
+    n, m = A.shape[0], len(lams)
+    if m == 0:
+        return np.empty((0, n))
+    if np.allclose(A, A.T):
+        order = np.argsort(lams)
+        d, e, reflectors = tridiagonalize(A)
+        Y = tridiagonal_inverse_iteration(d, e, lams[order], iterations, seed)
+        X = np.empty((m, n))
+        X[order] = apply_reflectors(reflectors, Y).T
+    else:
+        norm = max(float(np.abs(A).sum(axis=1).max()), 1.0)
+        X = np.random.default_rng(seed).uniform(-1.0, 1.0, (m, n))
+        size = max(1, INVERSE_ITERATION_ELEMENTS // (n * n))
+        for j0 in range(0, m, size):
+            chunk = slice(j0, j0 + size)
+            lu = BatchedLUFactorization(A - lams[chunk, None, None] * np.eye(n), pivot_floor=EPS * norm)
+            for _ in range(iterations):
+                X[chunk] = lu.solve(X[chunk])
+                X[chunk] /= np.linalg.norm(X[chunk], axis=1)[:, None]
+    last = n - 1 - np.argmax(np.abs(X[:, ::-1]) > 1e-8, axis=1)
+    X *= np.sign(X[np.arange(m), last])[:, None]
+    return X
+
+
+def eigen_pairs(A, method="danilevsky", coeffs=None):
+    """Собственные значения по возрастанию и собственные векторы.
+
+    method="danilevsky" — корни характеристического многочлена (coeffs, если уже посчитан)
+    и обратные итерации для всех корней сразу; method="symmetric" — для симметричной A:
+    трёхдиагонализация, бисекция по Штурму и обратные итерации за O(n^3).
+    """
+    if method == "symmetric":
+        w, V = eigh(A)
+        return w.tolist(), V.T.tolist()
+    if method != "danilevsky":
+        raise ValueError(f"Неизвестный метод: {method}")
+    if coeffs is None:
+        _, coeffs = danilevski_strict(A)
+    roots = real_roots(coeffs, gershgorin_bound(A)).tolist()
+    return roots, inverse_iteration(A, roots).tolist()
 
 
 # Степенной метод
@@ -486,7 +420,80 @@ def power_method(A, eps=0.001, max_iter=10000):
     return lam, x
 
 
-def main():
+def row_sum_bound(A) -> float:
+    """Оценка спектрального радиуса сверху: max_i sum_j |a_ij| (плотные и scipy.sparse матрицы)"""
+    if isinstance(A, (list, tuple)):
+        A = np.array(A, dtype=float)
+    if not hasattr(A, "__abs__"):
+        raise ValueError("Для оператора без элементов границу спектра нужно задать явно")
+    return float(np.max(abs(A).sum(axis=1)))
+
+
+def _chebyshev_filter(matvec, X, degree, lo, hi):
+    """Y = T_degree((A - c I) / e) X: спектр из [lo, hi] подавляется, правее hi — усиливается"""
+    e = 0.5 * (hi - lo)
+    c = 0.5 * (hi + lo)
+    Y_prev = X
+    Y = (matvec(X) - c * X) / e
+    for _ in range(degree - 1):
+        Y, Y_prev = 2.0 * (matvec(Y) - c * Y) / e - Y_prev, Y
+    return Y
+
+
+def subspace_iteration(A, k, eps=1e-8, max_iter=1000, block=None, filter_degree=0,
+                       lower_bound=None, seed=0):
+    """Блочный степенной метод (итерации подпространства) с процедурой Рэлея — Ритца.
+
+    Блок из block >= k векторов (по умолчанию k + min(k, 10)) за шаг умножается на A одним
+    матричным произведением, ортонормируется QR-разложением; собственные пары берутся
+    из малой матрицы Q^T A Q. A — плотная, scipy.sparse или LinearOperator (симметричная).
+    Без фильтра ищутся k наибольших по модулю собственных значений. filter_degree > 0 включает
+    фильтр Чебышёва: ищутся k наибольших, а спектр от lower_bound (по умолчанию -row_sum_bound(A))
+    до наименьшего значения Ритца в блоке подавляется многочленом этой степени.
+    Остановка — когда ||A v_j - θ_j v_j|| <= eps max(1, |θ_j|) для всех k пар.
+    """
+    matvec, n = as_operator(A)
+    block = min(n, block or k + min(k, 10))
+    if filter_degree and lower_bound is None:
+        lower_bound = -row_sum_bound(A)
+
+    start = perf_counter()
+    Z = np.random.default_rng(seed).standard_normal((n, block))
+    matvecs = 0
+    theta = np.zeros(block)
+    residual = np.full(block, np.inf)
+    # Без итераций (max_iter=0) возвращается ортонормированный начальный блок
+    Q = np.linalg.qr(Z)[0]
+    iterations = 0
+    for _ in range(max_iter):
+        iterations += 1
+        Q = np.linalg.qr(Z)[0]
+        W = matvec(Q)
+        matvecs += block
+        theta, S = np.linalg.eigh(Q.T @ W)
+        order = np.argsort(-theta) if filter_degree else np.argsort(-np.abs(theta))
+        theta, S = theta[order], S[:, order]
+        Q = Q @ S
+        W = W @ S
+        residual = np.linalg.norm(W - Q * theta, axis=0)
+        if np.all(residual[:k] <= eps * np.maximum(1.0, np.abs(theta[:k]))):
+            break
+        if filter_degree:
+            Z = _chebyshev_filter(matvec, Q, filter_degree, lower_bound, theta[-1])
+            matvecs += filter_degree * block
+        else:
+            Z = W
+    return {
+        "values": theta[:k],
+        "vectors": Q[:, :k],
+        "iterations": iterations,
+        "matvecs": matvecs,
+        "time": perf_counter() - start,
+        "residual": float(residual[:k].max()),
+    }
+
+
+def main(eigen_method="danilevsky"):
     xs, ys = prepare_data_N_equals_11()
     print("Задание 1: узлы x и значения y (N=11):")
     for x, y in zip(xs, ys):
@@ -511,7 +518,7 @@ def main():
     print("Проверка в промежуточных точках x_i + h/2:")
     for x in xs:
         xm = x + h / 2.0
-        Pxm = poly_eval_asc(P_x, xm)
+        Pxm = P_x(xm)
         print(f"x_mid={xm:0.4f}\tP(x_mid)={fmt(Pxm)}")
     print("")
 
@@ -539,7 +546,7 @@ def main():
     elif t == "sub":
         print("----")
     else:
-        print("(коэффициенты через Леверрье)")
+        print("(коэффициенты через форму Хессенберга)")
     print_matrix_A(A_fro)
     print("")
 
@@ -550,8 +557,7 @@ def main():
         print(f"c[{i}] = {fmt(c)}")
     print("")
 
-    R = gershgorin_bound(A)
-    roots = find_real_roots_scan(coeffs, R, n_roots=4)
+    roots, vectors = eigen_pairs(A, method=eigen_method, coeffs=coeffs)
 
     print("Собственные значения (корни):")
     for r in roots:
@@ -560,14 +566,7 @@ def main():
 
     if roots:
         print("Собственные векторы:")
-        for lamr in roots:
-            n = len(A)
-            M = [
-                [A[i][j] - (lamr if i == j else 0.0) for j in range(n)]
-                for i in range(n)
-            ]
-            v = nullspace_vector(M)
-
+        for lamr, v in zip(roots, vectors):
             print(f"lambda={lamr:0.4f}")
             for val in v:
                 print("v = " + fmt(val))
@@ -581,28 +580,29 @@ def main():
     for val in v_est:
         print(fmt(val))
 
-    try:
-        import numpy as np
+    block = subspace_iteration(A, 2, eps=1e-10)
+    print("\nБлочный степенной метод (k=2), Рэлей — Ритц:")
+    print(f"итераций: {block['iterations']}, умножений на вектор: {block['matvecs']}")
+    for lam in block["values"]:
+        print(f"lambda ≈ {fmt(float(lam))}")
 
-        Anp = np.array(A, dtype=float)
-        w, V = np.linalg.eigh(Anp)
+    Anp = np.array(A, dtype=float)
+    w, V = np.linalg.eigh(Anp)
 
-        print("\nСравнение с numpy:")
-        print("Собственные значения numpy:")
-        for wi in w:
-            print(fmt(float(wi)))
-        print("")
+    print("\nСравнение с numpy:")
+    print("Собственные значения numpy:")
+    for wi in w:
+        print(fmt(float(wi)))
+    print("")
 
-        print("Собственные векторы numpy (по одному на собственное значение):")
-        for i in range(len(w)):
-            lam = float(w[i])
-            vec = V[:, i]
-            print(f"lambda={lam:0.4f}")
-            for k in range(len(vec)):
-                print("v = " + fmt(float(vec[k])))
-            print("")
-    except Exception:
-        pass
+    print("Собственные векторы numpy (по одному на собственное значение):")
+    for i in range(len(w)):
+        lam = float(w[i])
+        vec = V[:, i]
+        print(f"lambda={lam:0.4f}")
+        for k in range(len(vec)):
+            print("v = " + fmt(float(vec[k])))
+        print("")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,250 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Столбцов правых частей в одном блоке solve_many / inverse
+RHS_BLOCK_SIZE = 256
+
+
+def _solve_lower(T: np.ndarray, Y: np.ndarray, nb: int, unit: bool) -> None:
+    """Решение T Y = Y на месте по нижнему треугольнику T, блоками по nb строк"""
+    n = T.shape[0]
+    for k0 in range(0, n, nb):
+        k1 = min(k0 + nb, n)
+        if k0:
+            Y[k0:k1] -= T[k0:k1, :k0] @ Y[:k0]
+        for k in range(k0, k1):
+            Y[k] -= T[k, k0:k] @ Y[k0:k]
+            if not unit:
+                Y[k] /= T[k, k]
+
+
+def _solve_upper(T: np.ndarray, Y: np.ndarray, nb: int, unit: bool) -> None:
+    """Решение T Y = Y на месте по верхнему треугольнику T, блоками по nb строк"""
+    n = T.shape[0]
+    for k0 in reversed(range(0, n, nb)):
+        k1 = min(k0 + nb, n)
+        if k1 < n:
+            Y[k0:k1] -= T[k0:k1, k1:] @ Y[k1:]
+        for k in range(k1 - 1, k0 - 1, -1):
+            Y[k] -= T[k, k + 1:k1] @ Y[k + 1:k1]
+            if not unit:
+                Y[k] /= T[k, k]
+
+
+class LUFactorization:
+    """LU-разложение с частичным выбором ведущего элемента: A[piv] = L U.
+
+    L — нижняя унитреугольная, U — верхняя треугольная; обе хранятся в одном массиве lu.
+    Разложение блочное: панель из block_size столбцов исключается ранг-1 обновлениями,
+    оставшаяся подматрица обновляется одним матричным произведением.
+    dtype=np.float32 вдвое сокращает память и ускоряет разложение; решение тогда
+    получается в той же пониженной точности (см. refinement.mixed_precision_solve).
+    """
+
+    def __init__(self, A, block_size: int = 64, dtype=float):
+        lu = np.array(A, dtype=dtype)
+        n = lu.shape[0]
+        if lu.ndim != 2 or lu.shape[1] != n:
+            raise ValueError("Матрица должна быть квадратной")
+
+        piv = np.arange(n)
+        sign = 1.0
+        singular = False
+
+        for k0 in range(0, n, block_size):
+            k1 = min(k0 + block_size, n)
+
+            # Разложение панели lu[k0:, k0:k1]
+            for k in range(k0, k1):
+                p = k + int(np.argmax(np.abs(lu[k:, k])))
+                if p != k:
+                    lu[[k, p]] = lu[[p, k]]
+                    piv[[k, p]] = piv[[p, k]]
+                    sign = -sign
+                if lu[k, k] == 0.0:
+                    singular = True
+                    continue
+                lu[k + 1:, k] /= lu[k, k]
+                lu[k + 1:, k + 1:k1] -= np.outer(lu[k + 1:, k], lu[k, k + 1:k1])
+
+            if k1 < n:
+                # Блок U12 = L11^-1 A12
+                for k in range(k0, k1):
+                    lu[k + 1:k1, k1:] -= np.outer(lu[k + 1:k1, k], lu[k, k1:])
+                # Дополнение Шура A22 -= L21 U12
+                lu[k1:, k1:] -= lu[k1:, k0:k1] @ lu[k0:k1, k1:]
+
+        self.lu = lu
+        self.piv = piv
+        self.sign = sign
+        self.singular = singular
+        self.block_size = block_size
+
+    @property
+    def n(self) -> int:
+        return self.lu.shape[0]
+
+    def solve(self, b, trans: bool = False) -> np.ndarray:
+        """Решение A x = b (или A^T x = b при trans=True) для вектора или матрицы правых частей"""
+        if self.singular:
+            raise ValueError("Матрица вырождена")
+        b = np.asarray(b, dtype=self.lu.dtype)
+        nb = self.block_size
+        if trans:
+            # A^T = U^T L^T P: U^T — нижняя, L^T — верхняя унитреугольная
+            Y = b.reshape(self.n, -1).copy()
+            _solve_lower(self.lu.T, Y, nb, unit=False)
+            _solve_upper(self.lu.T, Y, nb, unit=True)
+            X = np.empty_like(Y)
+            X[self.piv] = Y
+            return X.reshape(b.shape)
+        Y = b[self.piv].reshape(self.n, -1)
+        _solve_lower(self.lu, Y, nb, unit=True)
+        _solve_upper(self.lu, Y, nb, unit=False)
+        return Y.reshape(b.shape)
+
+    def inverse_norm1_estimate(self, max_iter: int = 5) -> float:
+        """Оценка ||A^-1||_1 методом Хейгера — Хайэма без вычисления обратной матрицы.
+
+        Каждая итерация — два решения треугольных систем (с A и A^T), обычно хватает 2–3 итераций.
+        """
+        n = self.n
+        x = np.full(n, 1.0 / n)
+        estimate = 0.0
+        for _ in range(max_iter):
+            y = self.solve(x)
+            new_estimate = float(np.abs(y).sum())
+            if new_estimate <= estimate:
+                break
+            estimate = new_estimate
+            xi = np.where(y >= 0, 1.0, -1.0)
+            z = self.solve(xi, trans=True)
+            j = int(np.argmax(np.abs(z)))
+            if abs(z[j]) <= z @ x:
+                break
+            x = np.zeros(n)
+            x[j] = 1.0
+
+        # Дополнительная проверка Хайэма на знакочередующемся векторе
+        if n > 1:
+            alt = (-1.0) ** np.arange(n) * (1.0 + np.arange(n) / (n - 1))
+            estimate = max(estimate, 2.0 * float(np.abs(self.solve(alt)).sum()) / (3.0 * n))
+        return estimate
+
+    def det(self) -> float:
+        """Определитель: знак перестановки на произведение диагонали U"""
+        return float(self.sign * np.prod(np.diag(self.lu)))
+
+    def _solve_columns(self, rhs, m: int, block_size: int, workers: int | None) -> np.ndarray:
+        """X (n × m) по блокам столбцов: rhs(c0, c1) — правые части блока, решения пишутся в свой срез X"""
+        X = np.empty((self.n, m), dtype=self.lu.dtype)
+
+        def work(c0):
+            c1 = min(c0 + block_size, m)
+            X[:, c0:c1] = self.solve(rhs(c0, c1))
+
+        starts = range(0, m, block_size)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(starts))
+        if workers <= 1:
+            for c0 in starts:
+                work(c0)
+        else:
+            with ThreadPoolExecutor(workers) as pool:
+                list(pool.map(work, starts))
+        return X
+
+    def solve_many(self, B, block_size: int = RHS_BLOCK_SIZE, workers: int | None = 1) -> np.ndarray:
+        """Решение A X = B для многих правых частей блоками по block_size столбцов B.
+
+        Разложение общее и только читается; матричные произведения треугольных решений
+        отпускают GIL, поэтому блоки могут идти параллельно. По умолчанию workers=1 —
+        последовательно, без пула; пул включается явно: workers=k или None (по числу ядер).
+        Потоки BLAS при этом лучше ограничить (OPENBLAS_NUM_THREADS=1), иначе они
+        конкурируют с пулом за те же ядра.
+        """
+        if self.singular:
+            raise ValueError("Матрица вырождена")
+        B = np.asarray(B, dtype=self.lu.dtype)
+        columns = B.reshape(self.n, -1)
+        X = self._solve_columns(lambda c0, c1: columns[:, c0:c1], columns.shape[1], block_size, workers)
+        return X.reshape(B.shape)
+
+    def inverse(self, block_size: int = RHS_BLOCK_SIZE, workers: int | None = 1) -> np.ndarray:
+        """Обратная матрица: n правых частей на одном разложении, O(n^3).
+
+        Столбцы единичной матрицы строятся по блокам, как в solve_many, без копии E целиком.
+        """
+        if self.singular:
+            raise ValueError("Матрица вырождена")
+        n = self.n
+        return self._solve_columns(lambda c0, c1: np.eye(n, c1 - c0, -c0), n, block_size, workers)
+
+
+def solve_many(A, B, block_size: int = RHS_BLOCK_SIZE, workers: int | None = 1) -> np.ndarray:
+    """Одно LU-разложение A и решение A X = B для всех столбцов B (см. LUFactorization.solve_many)"""
+    return LUFactorization(A).solve_many(B, block_size=block_size, workers=workers)
+
+
+class BatchedLUFactorization:
+    """LU-разложения стопки матриц A[i][piv[i]] = L_i U_i одной векторной программой.
+
+    Выбор ведущего элемента, перестановки строк и ранг-1 обновления выполняются сразу
+    для всех матриц стопки, поэтому цикл интерпретатора — n шагов на всю стопку.
+    pivot_floor > 0 заменяет ведущие элементы, меньшие его по модулю, на ±pivot_floor —
+    так разложение A - λI остаётся пригодным для обратных итераций при точном λ.
+    """
+
+    def __init__(self, A, pivot_floor: float = 0.0):
+        lu = np.array(A, dtype=float)
+        if lu.ndim != 3 or lu.shape[1] != lu.shape[2]:
+            raise ValueError("Нужна стопка квадратных матриц формы (m, n, n)")
+        m, n, _ = lu.shape
+        batch = np.arange(m)
+        piv = np.tile(np.arange(n), (m, 1))
+        sign = np.ones(m)
+        singular = np.zeros(m, dtype=bool)
+
+        for k in range(n):
+            p = k + np.argmax(np.abs(lu[:, k:, k]), axis=1)
+            lu[batch, k], lu[batch, p] = lu[batch, p], lu[batch, k]
+            piv[batch, k], piv[batch, p] = piv[batch, p], piv[batch, k]
+            sign[p != k] *= -1.0
+
+            pivot = lu[:, k, k]
+            small = np.abs(pivot) <= pivot_floor
+            pivot[small] = np.where(pivot[small] < 0, -pivot_floor, pivot_floor)
+            zero = pivot == 0.0
+            singular |= zero
+            lu[:, k + 1:, k] /= np.where(zero, 1.0, pivot)[:, None]
+            lu[:, k + 1:, k + 1:] -= lu[:, k + 1:, k, None] * lu[:, None, k, k + 1:]
+
+        self.lu = lu
+        self.piv = piv
+        self.sign = sign
+        self.singular = singular
+
+    @property
+    def n(self) -> int:
+        return self.lu.shape[1]
+
+    def solve(self, b) -> np.ndarray:
+        """Решение A[i] x[i] = b[i] для всей стопки; b формы (m, n) или (m, n, r)"""
+        if self.singular.any():
+            raise ValueError("Матрица вырождена")
+        b = np.asarray(b, dtype=float)
+        batch = np.arange(len(self.lu))[:, None]
+        Y = b[batch, self.piv].reshape(len(self.lu), self.n, -1)
+        lu = self.lu
+        for k in range(1, self.n):
+            Y[:, k] -= (lu[:, k, None, :k] @ Y[:, :k])[:, 0]
+        for k in range(self.n - 1, -1, -1):
+            Y[:, k] -= (lu[:, k, None, k + 1:] @ Y[:, k + 1:])[:, 0]
+            Y[:, k] /= lu[:, k, k, None]
+        return Y.reshape(b.shape)
+
+    def det(self) -> np.ndarray:
+        return self.sign * np.prod(np.diagonal(self.lu, axis1=1, axis2=2), axis=1)
@@ -0,0 +1,40 @@
+import sys
+
+import numpy as np
+
+
+def write_summary(array, stream=None) -> None:
+    """Строка со сводкой: размер, минимум, максимум, среднее и норма (Фробениуса для матриц)"""
+    stream = stream or sys.stdout
+    A = np.asarray(array, dtype=float)
+    shape = " × ".join(map(str, A.shape))
+    if A.size == 0:
+        stream.write(f"[{shape}] пусто\n")
+        return
+    stream.write(
+        f"[{shape}] min = {A.min():.6g}, max = {A.max():.6g}, "
+        f"среднее = {A.mean():.6g}, норма = {np.linalg.norm(A):.6g}\n"
+    )
+
+
+def write_array(array, stream=None, precision: int = 4, delimiter: str = "  ",
+                edge_rows: int | None = None, summary: bool = False) -> None:
+    """Вывод вектора (по элементу в строке) или матрицы (по строке матрицы) прямо в поток.
+
+    Строки форматируются np.savetxt — одной операцией форматирования на строку, без списка
+    строк Python под каждый элемент, и сразу пишутся в stream (по умолчанию sys.stdout;
+    для файла — open(path, "w", buffering=1 << 20)).
+    edge_rows=k — только первые и последние k строк с «...» между ними;
+    summary=True — в конце строка сводки write_summary.
+    """
+    stream = stream or sys.stdout
+    A = np.asarray(array, dtype=float)
+    fmt = f"%.{precision}f"
+    if edge_rows is not None and len(A) > 2 * edge_rows:
+        np.savetxt(stream, A[:edge_rows], fmt=fmt, delimiter=delimiter)
+        stream.write(f"... ({len(A) - 2 * edge_rows} строк пропущено)\n")
+        np.savetxt(stream, A[len(A) - edge_rows:], fmt=fmt, delimiter=delimiter)
+    elif len(A):
+        np.savetxt(stream, A, fmt=fmt, delimiter=delimiter)
+    if summary:
+        write_summary(A, stream)
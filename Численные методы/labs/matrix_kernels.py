@@ -0,0 +1,63 @@
+from operator import mul
+
+import numpy as np
+
+# Размер квадратного блока для версии на списках
+BLOCK_SIZE = 32
+# Число умножений n*p*m, начиная с которого numpy выгоднее даже с переводом списков в массивы
+# (см. bench/bench_matmul.py)
+NUMPY_THRESHOLD = 64
+
+
+def _shapes(A, B):
+    n, p = len(A), len(B)
+    m = len(B[0]) if p else 0
+    if n and len(A[0]) != p:
+        raise ValueError(f"Несогласованные размеры: {n}x{len(A[0])} на {p}x{m}")
+    return n, p, m
+
+
+def matmul_naive(A, B):
+    """Умножение матриц тройным циклом i-j-k (эталон для сравнения)"""
+    n, p, m = _shapes(A, B)
+    C = [[0.0] * m for _ in range(n)]
+    for i in range(n):
+        for j in range(m):
+            s = 0.0
+            for k in range(p):
+                s += A[i][k] * B[k][j]
+            C[i][j] = s
+    return C
+
+
+def matmul_blocked(A, B, block_size=BLOCK_SIZE):
+    """Блочное умножение матриц на списках.
+
+    B транспонируется один раз, чтобы столбцы читались как непрерывные кортежи; затем
+    блок строк A умножается на блок столбцов B, пока оба блока остаются в кэше.
+    Каждый элемент — скалярное произведение sum(map(mul, ...)) без интерпретируемого цикла по k.
+    """
+    n, p, m = _shapes(A, B)
+    BT = list(zip(*B))
+    C = [[0.0] * m for _ in range(n)]
+    for i0 in range(0, n, block_size):
+        rows = A[i0:i0 + block_size]
+        for j0 in range(0, m, block_size):
+            cols = BT[j0:j0 + block_size]
+            for Ci, Ai in zip(C[i0:i0 + block_size], rows):
+                Ci[j0:j0 + block_size] = [sum(map(mul, Ai, col)) for col in cols]
+    return C
+
+
+def matmul(A, B):
+    """Умножение матриц произвольных согласованных размеров.
+
+    Для numpy.ndarray сразу используется numpy; для списков путь выбирается по объёму работы
+    и результат возвращается списком списков.
+    """
+    if isinstance(A, np.ndarray) or isinstance(B, np.ndarray):
+        return np.asarray(A, dtype=float) @ np.asarray(B, dtype=float)
+    n, p, m = _shapes(A, B)
+    if n * p * m >= NUMPY_THRESHOLD:
+        return (np.array(A, dtype=float) @ np.array(B, dtype=float)).tolist()
+    return matmul_blocked(A, B)
@@ -0,0 +1,20 @@
+import numpy as np
+
+
+def as_operator(A, n: int = None):
+    """Функция умножения x -> A x и размерность задачи.
+
+    Подходят списки списков, numpy.ndarray, матрицы scipy.sparse и scipy LinearOperator:
+    всем им достаточно оператора @, поэтому scipy здесь не импортируется.
+    Готовая функция умножения (без атрибута shape) передаётся вместе с размерностью n.
+    """
+    if callable(A) and not hasattr(A, "shape"):
+        if n is None:
+            raise ValueError("Для функции умножения нужно указать размерность n")
+        return A, n
+    if isinstance(A, (list, tuple)):
+        A = np.array(A, dtype=float)
+    rows, cols = A.shape
+    if rows != cols:
+        raise ValueError("Матрица должна быть квадратной")
+    return (lambda x: A @ x), rows
@@ -0,0 +1,119 @@
+from functools import lru_cache
+
+import numpy as np
+
+# Начиная с такой длины результата свёртка через БПФ быстрее прямой
+FFT_THRESHOLD = 256
+
+
+@lru_cache(maxsize=32)
+def pascal_matrix(n: int) -> np.ndarray:
+    """Нижнетреугольная матрица биномиальных коэффициентов: P[k, j] = C(k, j)"""
+    P = np.zeros((n, n))
+    P[:, 0] = 1.0
+    for k in range(1, n):
+        P[k, 1:k + 1] = P[k - 1, :k] + P[k - 1, 1:k + 1]
+    P.flags.writeable = False
+    return P
+
+
+def convolve(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Свёртка коэффициентов: прямая для малых степеней, через БПФ для больших.
+
+    БПФ даёт ошибку порядка eps * max|p| * max|q| в каждом коэффициенте,
+    поэтому малые коэффициенты на фоне больших теряют относительную точность.
+    """
+    size = len(p) + len(q) - 1
+    if size < FFT_THRESHOLD:
+        return np.convolve(p, q)
+    nfft = 1 << (size - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(p, nfft) * np.fft.rfft(q, nfft), nfft)[:size]
+
+
+class Polynomial:
+    """Многочлен с коэффициентами по возрастанию степеней: coeffs[k] — коэффициент при x^k"""
+
+    def __init__(self, coeffs):
+        coeffs = np.array(coeffs, dtype=float).ravel()
+        self.coeffs = coeffs if coeffs.size else np.zeros(1)
+        self._scalar_coeffs = self.coeffs[::-1].tolist()
+
+    @classmethod
+    def from_desc(cls, coeffs_desc) -> "Polynomial":
+        """Многочлен по коэффициентам в порядке убывания степеней"""
+        return cls(np.asarray(coeffs_desc, dtype=float)[::-1])
+
+    def to_desc(self) -> np.ndarray:
+        return self.coeffs[::-1].copy()
+
+    @property
+    def degree(self) -> int:
+        return len(self.coeffs) - 1
+
+    def __len__(self) -> int:
+        return len(self.coeffs)
+
+    def __getitem__(self, k):
+        return self.coeffs[k]
+
+    def __call__(self, x):
+        """Значение по схеме Горнера; для массива x — сразу во всех точках"""
+        if np.isscalar(x):
+            s = 0.0
+            for a in self._scalar_coeffs:
+                s = s * x + a
+            return s
+        x = np.asarray(x, dtype=float)
+        s = np.full(x.shape, self.coeffs[-1])
+        for a in self.coeffs[-2::-1]:
+            s *= x
+            s += a
+        return s
+
+    def _binary(self, other, sign: float) -> "Polynomial":
+        if not isinstance(other, Polynomial):
+            other = Polynomial([other])
+        n = max(len(self), len(other))
+        r = np.zeros(n)
+        r[:len(self)] += self.coeffs
+        r[:len(other)] += sign * other.coeffs
+        return Polynomial(r)
+
+    def __add__(self, other) -> "Polynomial":
+        return self._binary(other, 1.0)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> "Polynomial":
+        return self._binary(other, -1.0)
+
+    def __rsub__(self, other) -> "Polynomial":
+        return (-self)._binary(other, 1.0)
+
+    def __neg__(self) -> "Polynomial":
+        return Polynomial(-self.coeffs)
+
+    def __mul__(self, other) -> "Polynomial":
+        if isinstance(other, Polynomial):
+            return Polynomial(convolve(self.coeffs, other.coeffs))
+        return Polynomial(self.coeffs * other)
+
+    __rmul__ = __mul__
+
+    def derivative(self) -> "Polynomial":
+        return Polynomial(self.coeffs[1:] * np.arange(1, len(self)))
+
+    def compose_linear(self, alpha: float, beta: float) -> "Polynomial":
+        """Многочлен q(x) = p(alpha x + beta) одним умножением на матрицу биномиальных коэффициентов.
+
+        q_j = sum_k c_k C(k, j) alpha^j beta^(k - j).
+        """
+        n = len(self)
+        j = np.arange(n)
+        shift = np.subtract.outer(j, j)  # k - j для элемента [k, j]
+        beta_powers = np.where(shift >= 0, float(beta) ** np.maximum(shift, 0), 0.0)
+        M = pascal_matrix(n) * beta_powers * float(alpha) ** j
+        return Polynomial(self.coeffs @ M)
+
+    def __repr__(self) -> str:
+        return f"Polynomial({self.coeffs.tolist()})"
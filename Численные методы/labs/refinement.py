@@ -0,0 +1,64 @@
+import numpy as np
+
+from lu import LUFactorization
+
+EPS = np.finfo(float).eps
+
+
+def refine(A, b, solve, max_iter: int = 10) -> dict:
+    """Итерационное уточнение решения A x = b с невязкой в двойной точности.
+
+    solve(r) — приближённый решатель A d = r, обычно одно разложение в float32,
+    используемое на всех шагах. Невязка r = b - A x считается в float64 и перед решением
+    нормируется, чтобы малые поправки не уходили в антипереполнение одинарной точности.
+    Остановка — когда обратная ошибка ||r|| / (||A|| ||x|| + ||b||) не превышает
+    sqrt(n) eps (критерий LAPACK dsgesv) или перестаёт уменьшаться хотя бы вдвое.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    n = A.shape[0]
+    norm_a = float(np.abs(A).sum(axis=1).max(initial=0.0))
+    norm_b = float(np.abs(b).max(initial=0.0))
+    target = np.sqrt(n) * EPS
+
+    x = np.asarray(solve(b), dtype=float)
+    best_x, best_error = x, np.inf
+    for iteration in range(max_iter + 1):
+        r = b - A @ x
+        norm_r = float(np.abs(r).max(initial=0.0))
+        scale = norm_a * float(np.abs(x).max(initial=0.0)) + norm_b
+        error = norm_r / scale if scale > 0.0 else norm_r
+        # nan (вырожденный множитель) тоже считается отсутствием прогресса
+        if not error < 0.5 * best_error:
+            break
+        best_x, best_error = x, error
+        if error <= target or iteration == max_iter:
+            break
+        x = x + norm_r * np.asarray(solve(r / norm_r), dtype=float)
+    return {
+        "x": best_x,
+        "iterations": iteration,
+        "error": best_error,
+        "converged": bool(best_error <= target),
+    }
+
+
+def mixed_precision_solve(A, b, factor=LUFactorization, low=np.float32, max_iter: int = 10) -> dict:
+    """Решение A x = b с точностью float64 по разложению в пониженной точности.
+
+    factor(A, dtype=...) строит разложение с методом solve (по умолчанию LUFactorization);
+    оно делается один раз в low, после чего refine доводит обратную ошибку до уровня float64.
+    Если уточнение не сходится (cond(A) порядка 1 / eps float32 и больше) или разложение
+    в low вырождено, задача решается заново по разложению в float64.
+    В результат добавляется "dtype" — точность использованного разложения.
+    """
+    A = np.asarray(A, dtype=float)
+    lowered = factor(A, dtype=low)
+    if not getattr(lowered, "singular", False):
+        result = refine(A, b, lowered.solve, max_iter)
+        if result["converged"]:
+            result["dtype"] = np.dtype(low).name
+            return result
+    result = refine(A, b, factor(A, dtype=float).solve, max_iter)
+    result["dtype"] = "float64"
+    return result
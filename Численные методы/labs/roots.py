@@ -0,0 +1,207 @@
+import numpy as np
+from numpy.polynomial import polynomial as npoly
+
+from polynomial import Polynomial
+
+# Коэффициент остатка считается нулевым, если он меньше REL_TOL * max|коэффициента делимого|
+REL_TOL = 1e-12
+# Собственное значение сопровождающей матрицы считается вещественным при |Im z| <= IMAG_TOL * max(1, |z|)
+IMAG_TOL = 1e-7
+MAX_ITER = 200
+# Значение многочлена считается нулём, если не превышает ZERO_TOL * deg * sum |c_k| |x|^k —
+# оценки ошибки округления схемы Горнера; знак такого значения случаен
+ZERO_TOL = 4.0 * np.finfo(float).eps
+# Доли интервала, куда сдвигается точка деления, попавшая в корень
+NUDGES = (0.5 + 1 / 7, 0.5 - 1 / 11, 0.5 + 1 / 13)
+
+
+def cauchy_bound(poly: Polynomial) -> float:
+    """Все корни лежат в круге |x| <= 1 + max |a_k / a_n|"""
+    c = poly.coeffs
+    return 1.0 + float(np.max(np.abs(c[:-1] / c[-1]))) if len(c) > 1 else 1.0
+
+
+def _trim(c: np.ndarray, scale: float) -> np.ndarray:
+    nonzero = np.flatnonzero(np.abs(c) > REL_TOL * scale)
+    return c[:nonzero[-1] + 1] if len(nonzero) else c[:0]
+
+
+def sturm_sequence(poly: Polynomial):
+    """Последовательность Штурма p, p', -rem(p_{k-1}, p_k), ...
+
+    Каждый член нормируется на max|коэффициента| — положительный множитель не меняет знаков.
+    """
+    seq = [poly.coeffs / np.max(np.abs(poly.coeffs))]
+    d = poly.derivative().coeffs
+    seq.append(d / np.max(np.abs(d)))
+    while len(seq[-1]) > 1:
+        rem = -npoly.polydiv(seq[-2], seq[-1])[1]
+        rem = _trim(rem, np.max(np.abs(seq[-2])))
+        if not len(rem):
+            break
+        seq.append(rem / np.max(np.abs(rem)))
+    return [Polynomial(c) for c in seq]
+
+
+def signs(poly: Polynomial, x) -> np.ndarray:
+    """Знаки p(x) с нулём там, где |p(x)| не превышает ошибки округления вычисления"""
+    x = np.asarray(x, dtype=float)
+    value = poly(x)
+    noise = ZERO_TOL * len(poly.coeffs) * Polynomial(np.abs(poly.coeffs))(np.abs(x))
+    return np.where(np.abs(value) <= noise, 0.0, np.sign(value))
+
+
+def sign_changes(seq, x) -> np.ndarray:
+    """Число перемен знака последовательности Штурма во всех точках x сразу"""
+    # Нуль в середине последовательности стоит между разными знаками — его знак не важен,
+    # поэтому погрешность округления учитывается только у самого многочлена;
+    # его нуль (x — корень) просто пропускается
+    s = np.array([signs(seq[0], x)] + [np.sign(p(x)) for p in seq[1:]])
+    s[0] = np.where(s[0] == 0, s[1], s[0])
+    s[s == 0] = 1
+    return np.count_nonzero(s[:-1] * s[1:] < 0, axis=0)
+
+
+def isolate_roots(poly: Polynomial, bound: float, tol: float = 1e-12):
+    """Интервалы (lo, hi], в каждом из которых ровно один различный вещественный корень.
+
+    Все интервалы текущего уровня делятся пополам одним векторным вычислением
+    последовательности Штурма; интервалы без корней отбрасываются.
+    Если интервал сузился до tol, а корней в нём больше одного, он возвращается с их числом.
+    """
+    seq = sturm_sequence(poly)
+    lo = np.array([-bound])
+    hi = np.array([bound])
+    v_lo = sign_changes(seq, lo)
+    v_hi = sign_changes(seq, hi)
+    done_lo, done_hi, done_count = [], [], []
+    for _ in range(MAX_ITER):
+        count = v_lo - v_hi
+        keep = count > 0
+        lo, hi, v_lo, v_hi, count = lo[keep], hi[keep], v_lo[keep], v_hi[keep], count[keep]
+        final = (count == 1) | (hi - lo <= tol * np.maximum(1.0, np.abs(lo)))
+        done_lo.append(lo[final])
+        done_hi.append(hi[final])
+        done_count.append(count[final])
+        lo, hi, v_lo, v_hi = lo[~final], hi[~final], v_lo[~final], v_hi[~final]
+        if not len(lo):
+            break
+        mid = 0.5 * (lo + hi)
+        # Точка деления не должна попадать в корень: там (для кратного корня — во всех членах)
+        # последовательность обращается в нуль и счёт перемен знака ненадёжен
+        for shift in NUDGES:
+            on_root = signs(poly, mid) == 0
+            if not on_root.any():
+                break
+            mid = np.where(on_root, lo + shift * (hi - lo), mid)
+        v_mid = sign_changes(seq, mid)
+        lo, hi = np.concatenate([lo, mid]), np.concatenate([mid, hi])
+        v_lo, v_hi = np.concatenate([v_lo, v_mid]), np.concatenate([v_mid, v_hi])
+    return np.concatenate(done_lo), np.concatenate(done_hi), np.concatenate(done_count)
+
+
+def polish(poly: Polynomial, lo, hi, tol: float = 1e-12) -> np.ndarray:
+    """Метод Ньютона с защитой бисекцией сразу для всех интервалов.
+
+    Шаг Ньютона, выходящий за текущий интервал, заменяется делением пополам; интервал
+    сжимается по знаку p. Если на концах знаки одинаковы (корень чётной кратности),
+    остаётся чистый Ньютон, ограниченный интервалом.
+    Интервалы полуоткрытые (lo, hi]: если lo — сам корень (точка деления попала в корень),
+    знак слева берётся правее lo — по первой ненулевой производной в lo. Нулём здесь
+    считается значение в пределах ошибки округления (см. signs).
+    """
+    dpoly = poly.derivative()
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    s_lo = signs(poly, lo)
+    d = dpoly
+    while np.any(s_lo == 0) and len(d.coeffs):
+        s_lo = np.where(s_lo == 0, signs(d, lo), s_lo)
+        d = d.derivative()
+    s_hi = signs(poly, hi)
+    bracketed = s_lo * s_hi <= 0
+    # Корень в правом конце (точке деления) с точностью округления уточнять не нужно
+    x = np.where(s_hi == 0, hi, 0.5 * (lo + hi))
+    active = s_hi != 0
+    for _ in range(MAX_ITER):
+        if not active.any():
+            break
+        xa = x[active]
+        f = poly(xa)
+        df = dpoly(xa)
+        left = bracketed[active] & (np.sign(f) == s_lo[active])
+        lo_a = np.where(left, xa, lo[active])
+        hi_a = np.where(bracketed[active] & ~left, xa, hi[active])
+        lo[active], hi[active] = lo_a, hi_a
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = xa - f / df
+        outside = ~np.isfinite(step) | (step <= lo_a) | (step >= hi_a)
+        step = np.where(outside & bracketed[active], 0.5 * (lo_a + hi_a), step)
+        step = np.clip(step, lo_a, hi_a)
+        converged = (f == 0.0) | (np.abs(step - xa) <= tol * np.maximum(1.0, np.abs(xa)))
+        x[active] = np.where(f == 0.0, xa, step)
+        idx = np.flatnonzero(active)
+        active[idx[converged]] = False
+    return x
+
+
+def companion_roots(poly: Polynomial, tol: float = 1e-12) -> np.ndarray:
+    """Вещественные корни как собственные значения сопровождающей матрицы с доуточнением Ньютоном"""
+    c = poly.coeffs
+    n = len(c) - 1
+    if n < 1:
+        return np.empty(0)
+    C = np.zeros((n, n))
+    C[1:, :-1] = np.eye(n - 1)
+    C[:, -1] = -c[:-1] / c[-1]
+    z = np.linalg.eigvals(C)
+    x = np.sort(z[np.abs(z.imag) <= IMAG_TOL * np.maximum(1.0, np.abs(z))].real)
+
+    dpoly = poly.derivative()
+    for _ in range(10):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = poly(x) / dpoly(x)
+        step[~np.isfinite(step)] = 0.0
+        x = x - step
+        if np.all(np.abs(step) <= tol * np.maximum(1.0, np.abs(x))):
+            break
+    return np.sort(x)
+
+
+def grid_roots(poly: Polynomial, bound: float, points: int = 20000, tol: float = 1e-12) -> np.ndarray:
+    """Перебор смен знака на равномерной сетке (значения во всех узлах — один вызов) и доуточнение.
+
+    Корни чётной кратности и пары корней ближе шага сетки пропускаются.
+    """
+    xs = np.linspace(-bound, bound, points + 1)
+    vals = poly(xs)
+    exact = xs[vals == 0.0]
+    change = np.flatnonzero(np.sign(vals[:-1]) * np.sign(vals[1:]) < 0)
+    return np.sort(np.concatenate([exact, polish(poly, xs[change], xs[change + 1], tol)]))
+
+
+def real_roots(coeffs_desc, bound: float = None, method: str = "sturm", tol: float = 1e-12) -> np.ndarray:
+    """Вещественные корни многочлена по коэффициентам в порядке убывания степеней.
+
+    method="sturm" — отделение корней последовательностью Штурма и защищённый Ньютон;
+    method="companion" — собственные значения сопровождающей матрицы;
+    method="grid" — смены знака на сетке. bound — радиус поиска (по умолчанию граница Коши).
+    Кратные корни, которые нельзя разделить с точностью tol, повторяются по числу
+    различных корней в кластере.
+    """
+    poly = Polynomial.from_desc(np.trim_zeros(np.asarray(coeffs_desc, dtype=float), "f"))
+    if poly.degree < 1:
+        return np.empty(0)
+    if bound is None:
+        bound = cauchy_bound(poly)
+    if method == "companion":
+        x = companion_roots(poly, tol)
+        return x[np.abs(x) <= bound]
+    if method == "grid":
+        return grid_roots(poly, bound, tol=tol)
+    if method != "sturm":
+        raise ValueError(f"Неизвестный метод: {method}")
+    lo, hi, count = isolate_roots(poly, bound, tol)
+    x = polish(poly, lo, hi, tol)
+    return np.sort(np.repeat(x, count))
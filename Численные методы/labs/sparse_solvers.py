@@ -0,0 +1,180 @@
+from time import perf_counter
+
+import numpy as np
+
+# До этого порядка системы по умолчанию решаются прямо (splu), дальше — итерационно
+DIRECT_MAX_N = 50_000
+
+
+def is_sparse(A) -> bool:
+    """Матрица scipy.sparse — проверка без импорта scipy"""
+    return hasattr(A, "tocsr") and hasattr(A, "nnz")
+
+
+def is_symmetric(A, tol: float = 1e-12) -> bool:
+    """Симметричность с точностью tol относительно наибольшего по модулю элемента"""
+    A = A.tocsr()
+    scale = abs(A).max()
+    diff = A - A.T
+    return diff.nnz == 0 or abs(diff).max() <= tol * scale
+
+
+def jacobi_preconditioner(A):
+    """Предобусловливатель Якоби: x -> D^-1 x"""
+    from scipy.sparse.linalg import LinearOperator
+
+    d = A.diagonal()
+    if np.any(d == 0.0):
+        raise ValueError("Нулевой диагональный элемент: предобусловливатель Якоби неприменим")
+    inv_d = 1.0 / d
+    return LinearOperator(A.shape, matvec=lambda x: inv_d * x.ravel(), dtype=float)
+
+
+def ilu0(A):
+    """Неполное LU-разложение без заполнения ILU(0): L и U на портрете A.
+
+    Вариант IKJ (Саад, алгоритм 10.4) по строкам CSR: для каждого a_ik левее диагонали
+    строка i обновляется строкой k только в позициях, уже занятых в строке i.
+    Строки короткие, поэтому цикл идёт по спискам Python со словарём позиций строки —
+    это в разы быстрее поэлементных вызовов numpy.
+    Возвращает L (унитреугольная, единицы на диагонали хранятся явно) и U в формате CSR.
+    """
+    from scipy.sparse import csr_matrix, eye, tril, triu
+
+    A = csr_matrix(A, dtype=float, copy=True)
+    A.sum_duplicates()
+    A.sort_indices()
+    n = A.shape[0]
+    indptr = A.indptr.tolist()
+    indices = A.indices.tolist()
+    data = A.data.tolist()
+    diag = [0] * n
+    for i in range(n):
+        row = {indices[p]: p for p in range(indptr[i], indptr[i + 1])}
+        if i not in row:
+            raise ValueError(f"Нет диагонального элемента в строке {i}")
+        diag[i] = row[i]
+        for p in range(indptr[i], diag[i]):
+            k = indices[p]
+            pivot = data[diag[k]]
+            if pivot == 0.0:
+                raise ValueError(f"Нулевой ведущий элемент ILU(0) в строке {k}")
+            a = data[p] = data[p] / pivot
+            for q in range(diag[k] + 1, indptr[k + 1]):
+                j = row.get(indices[q])
+                if j is not None:
+                    data[j] -= a * data[q]
+    A.data[:] = data
+
+    L = (tril(A, k=-1) + eye(n)).tocsr()
+    U = triu(A).tocsr()
+    return L, U
+
+
+def ilu0_preconditioner(A):
+    """Предобусловливатель ILU(0): x -> U^-1 L^-1 x двумя треугольными решениями.
+
+    Треугольные множители передаются SuperLU без перестановок (NATURAL, без выбора
+    ведущих), так что их разложение не даёт заполнения, а решения идут в скомпилированном коде.
+    Возвращает предобусловливатель и заполнение nnz(L + U) / nnz(A).
+    """
+    from scipy.sparse.linalg import LinearOperator, splu
+
+    L, U = ilu0(A)
+    options = {"permc_spec": "NATURAL", "diag_pivot_thresh": 0.0}
+    lower = splu(L.tocsc(), **options)
+    upper = splu(U.tocsc(), **options)
+
+    def matvec(x):
+        return upper.solve(lower.solve(np.ravel(x)))
+
+    return LinearOperator(A.shape, matvec=matvec, dtype=float), (L.nnz + U.nnz - A.shape[0]) / A.nnz
+
+
+def _preconditioner(A, kind):
+    """Предобусловливатель и заполнение его множителей (nnz / nnz(A)); None — без множителей"""
+    if kind is None:
+        return None, None
+    if kind == "jacobi":
+        return jacobi_preconditioner(A), None
+    if kind == "ilu0":
+        return ilu0_preconditioner(A)
+    raise ValueError(f"Неизвестный предобусловливатель: {kind}")
+
+
+def sparse_solve(A, f, method: str = "auto", preconditioner: str | None = "jacobi", tol: float = 1e-10,
+                 max_iter: int | None = None, log=None) -> dict:
+    """Решение разреженной системы A x = f без перехода к плотной матрице.
+
+    method: "splu" — разреженное LU (SuperLU, упорядочение COLAMD), "cg" — сопряжённые градиенты
+    (только для симметричных положительно определённых A), "bicgstab" — BiCGSTAB;
+    "auto" — splu при n <= DIRECT_MAX_N, иначе cg для симметричной матрицы с положительной
+    диагональю и bicgstab для остальных. Положительная диагональ не гарантирует
+    положительной определённости, поэтому если выбранный так cg не сошёлся или сорвался,
+    система решается заново bicgstab: метод в результате — "cg->bicgstab", а число
+    итераций — только итерации bicgstab.
+    preconditioner для итерационных методов: "jacobi", "ilu0" или None. ILU(0) обычно втрое
+    сокращает число итераций, но строится циклом интерпретатора — окупается на трудных задачах.
+    log — IterationLog, куда пишутся нормы невязки итераций (стоит лишнего умножения на A).
+    Возвращает x, метод, число итераций, признак сходимости (False — итерационный метод
+    исчерпал max_iter), заполнение (nnz множителей / nnz(A)), время и относительную
+    невязку ||f - A x|| / ||f||.
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.linalg import bicgstab, cg, splu
+
+    start = perf_counter()
+    A = csr_matrix(A, dtype=float)
+    f = np.asarray(f, dtype=float)
+    n = A.shape[0]
+    if A.shape[1] != n:
+        raise ValueError("Матрица должна быть квадратной")
+    fallback = False
+    if method == "auto":
+        if n <= DIRECT_MAX_N:
+            method = "splu"
+        elif is_symmetric(A) and np.all(A.diagonal() > 0.0):
+            method = "cg"
+            fallback = True
+        else:
+            method = "bicgstab"
+
+    iterations = 0
+    fill_in = None
+    converged = True
+    if method == "splu":
+        lu = splu(A.tocsc())
+        x = lu.solve(f)
+        fill_in = (lu.L.nnz + lu.U.nnz - n) / A.nnz
+    elif method in ("cg", "bicgstab"):
+        M, fill_in = _preconditioner(A, preconditioner)
+
+        def callback(xk):
+            nonlocal iterations
+            iterations += 1
+            if log is not None:
+                log.append(xk if log.dim else None, float(np.linalg.norm(f - A @ xk)))
+
+        solver = cg if method == "cg" else bicgstab
+        x, info = solver(A, f, rtol=tol, maxiter=max_iter, M=M, callback=callback)
+        if info != 0 and fallback:
+            # A, видимо, не положительно определена: cg неприменим, итерации считаются заново
+            method = "cg->bicgstab"
+            iterations = 0
+            x, info = bicgstab(A, f, rtol=tol, maxiter=max_iter, M=M, callback=callback)
+        if info < 0:
+            raise ValueError(f"{method}: недопустимые данные или срыв метода")
+        converged = info == 0
+    else:
+        raise ValueError(f"Неизвестный метод: {method}")
+
+    norm_f = np.linalg.norm(f)
+    return {
+        "x": x,
+        "method": method,
+        "iterations": iterations,
+        "converged": converged,
+        "fill_in": fill_in,
+        "time": perf_counter() - start,
+        "residual": float(np.linalg.norm(f - A @ x) / norm_f) if norm_f > 0.0 else 0.0,
+    }
@@ -0,0 +1,106 @@
+from itertools import islice
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from polynomial import Polynomial
+
+# Строк в порции: матрица Вандермонда порции при deg=50 занимает ~27 МБ
+CHUNK_SIZE = 1 << 16
+
+
+def csv_chunks(path, chunk_size: int = CHUNK_SIZE, delimiter: str = ",", skiprows: int = 0):
+    """Порции (x, y) из текстового файла с двумя столбцами; в памяти одна порция"""
+    with open(path) as f:
+        for _ in range(skiprows):
+            next(f, None)
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            data = np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+            yield data[:, 0], data[:, 1]
+
+
+def binary_chunks(path, chunk_size: int = CHUNK_SIZE, dtype="float64"):
+    """Порции (x, y) из двоичного файла пар x0 y0 x1 y1 ...; файл отображается в память (memmap)"""
+    data = np.memmap(path, dtype=dtype, mode="r").reshape(-1, 2)
+    for i in range(0, len(data), chunk_size):
+        chunk = np.asarray(data[i:i + chunk_size], dtype=float)
+        yield chunk[:, 0], chunk[:, 1]
+
+
+class StreamingChebyshevFit:
+    """МНК-приближение степени deg на [a, b] по потоку порций данных.
+
+    Накапливаются только достаточные статистики в базисе Чебышёва T_j(t), t = alpha x + beta:
+    матрица Грама G = V^T V, моменты m = V^T y, сумма y^2 и число точек — O(deg^2) памяти
+    при любом числе точек. Ортогональные на узлах многочлены получаются процессом
+    Грама — Шмидта в скалярном произведении (u, v) = u^T G v, поэтому ck и P_x совпадают
+    с least_squares_discrete_chebyshev при a = xs[0], b = xs[-1].
+    """
+
+    def __init__(self, a: float, b: float, deg: int = 3):
+        if b <= a:
+            raise ValueError("Нужно a < b")
+        self.a = a
+        self.b = b
+        self.deg = deg
+        self.alpha = 2.0 / (b - a)
+        self.beta = -(a + b) / (b - a)
+        self.gram = np.zeros((deg + 1, deg + 1))
+        self.moments = np.zeros(deg + 1)
+        self.y_square = 0.0
+        self.count = 0
+        self.cheb_coeffs = None
+
+    def update(self, x, y) -> None:
+        """Учёт очередной порции точек"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        V = chebyshev.chebvander(self.alpha * x + self.beta, self.deg)
+        self.gram += V.T @ V
+        self.moments += V.T @ y
+        self.y_square += float(y @ y)
+        self.count += len(x)
+
+    def consume(self, chunks) -> "StreamingChebyshevFit":
+        for x, y in chunks:
+            self.update(x, y)
+        return self
+
+    def fit(self) -> dict:
+        """Коэффициенты ck по дискретным ортогональным многочленам, P_t, P_x и среднеквадратичная невязка"""
+        n = self.deg + 1
+        G = self.gram
+        S = np.eye(n)  # столбец k — коэффициенты q_k в базисе T_j
+        for k in range(n):
+            for j in range(k):
+                S[:, k] -= (S[:, j] @ G @ S[:, k]) / (S[:, j] @ G @ S[:, j]) * S[:, j]
+        norms = np.einsum("ik,ij,jk->k", S, G, S)
+        if np.any(norms <= 0.0):
+            raise ValueError("Нулевая норма при построении ортогональных полиномов")
+        proj = (S.T @ self.moments) / norms
+
+        # q_k = 2^(k-1) p_k, где p_k — монический многочлен пакетного метода
+        lead = np.ones(n)
+        lead[1:] = 2.0 ** np.arange(n - 1)
+        ck = proj * lead
+
+        self.cheb_coeffs = S @ proj
+        P_t = Polynomial(chebyshev.cheb2poly(self.cheb_coeffs))
+        residual = max(self.y_square - float(proj @ (norms * proj)), 0.0)
+        return {
+            "ck": ck.tolist(),
+            "cheb": self.cheb_coeffs,
+            "P_t": P_t,
+            "P_x": P_t.compose_linear(self.alpha, self.beta),
+            "rms": (residual / self.count) ** 0.5 if self.count else 0.0,
+            "count": self.count,
+        }
+
+    def evaluate(self, x):
+        """Значение приближения по рядам Чебышёва (после fit) — без степенной базы"""
+        if self.cheb_coeffs is None:
+            raise RuntimeError("Коэффициенты ещё не вычислены: сначала вызовите fit()")
+        return chebyshev.chebval(self.alpha * np.asarray(x, dtype=float) + self.beta, self.cheb_coeffs)
@@ -0,0 +1,179 @@
+import numpy as np
+
+EPS = np.finfo(float).eps
+# Собственные значения ближе CLUSTER_GAP * ||T|| считаются кластером: их векторы ортогонализуются
+CLUSTER_GAP = 1e-3
+INVERSE_ITERATIONS = 3
+# Отражений в одном блоке при обратном преобразовании (компактная WY-форма)
+BLOCK_SIZE = 32
+
+
+def tridiagonalize(A):
+    """Приведение симметричной матрицы к трёхдиагональной форме отражениями Хаусхолдера: A = Q T Q^T.
+
+    Возвращает диагональ d, поддиагональ e и список отражений (k, v, beta), H_k = I - beta v v^T
+    на строках k+1:. Каждый шаг — одно матрично-векторное произведение и ранг-2 обновление
+    оставшейся подматрицы, всего O(n^3).
+    """
+    A = np.array(A, dtype=float)
+    n = A.shape[0]
+    if A.ndim != 2 or A.shape[1] != n:
+        raise ValueError("Матрица должна быть квадратной")
+    e = np.zeros(max(n - 1, 0))
+    reflectors = []
+    for k in range(n - 2):
+        x = A[k + 1:, k]
+        norm_x = np.linalg.norm(x)
+        if norm_x == 0.0 or np.linalg.norm(x[1:]) == 0.0:
+            e[k] = x[0]
+            continue
+        alpha = -norm_x if x[0] >= 0 else norm_x
+        v = x.copy()
+        v[0] -= alpha
+        beta = 2.0 / (v @ v)
+        sub = A[k + 1:, k + 1:]
+        p = beta * (sub @ v)
+        w = p - 0.5 * beta * (v @ p) * v
+        sub -= np.column_stack([v, w]) @ np.vstack([w, v])
+        e[k] = alpha
+        reflectors.append((k, v, beta))
+    if n > 1:
+        e[n - 2] = A[n - 1, n - 2]
+    return np.diag(A).copy(), e, reflectors
+
+
+def apply_reflectors(reflectors, Y, block_size=BLOCK_SIZE):
+    """Y := Q Y — перевод собственных векторов T в собственные векторы A.
+
+    Отражения собираются в блоки по block_size в компактной WY-форме H_a ... H_b = I - V T V^T,
+    так что каждый блок применяется тремя матричными произведениями вместо b ранг-1 обновлений.
+    """
+    for b0 in reversed(range(0, len(reflectors), block_size)):
+        block = reflectors[b0:b0 + block_size]
+        start = block[0][0] + 1
+        V = np.zeros((Y.shape[0] - start, len(block)))
+        T = np.zeros((len(block), len(block)))
+        for j, (k, v, beta) in enumerate(block):
+            V[k + 1 - start:, j] = v
+            T[:j, j] = -beta * (T[:j, :j] @ (V[:, :j].T @ V[:, j]))
+            T[j, j] = beta
+        Y[start:] -= V @ (T @ (V.T @ Y[start:]))
+    return Y
+
+
+def sturm_count(d, e, x):
+    """Число собственных значений трёхдиагональной матрицы, меньших x, для всех x сразу.
+
+    Рекуррентность q_i = d_i - x - e_{i-1}^2 / q_{i-1} по Штурму; число отрицательных q_i
+    равно числу собственных значений левее x. Нулевой q_i до подсчёта знака заменяется
+    малой положительной величиной (сдвиг x влево), так что значение, равное x, не считается.
+    """
+    x = np.asarray(x, dtype=float)
+    e2 = e * e
+    tiny = EPS * max(np.abs(e).max(initial=0.0), np.abs(d).max(initial=0.0), 1.0)
+    q = np.where(d[0] == x, tiny, d[0] - x)
+    count = (q < 0).astype(int)
+    for i in range(1, len(d)):
+        q = d[i] - x - e2[i - 1] / q
+        q = np.where(q == 0.0, tiny, q)
+        count += q < 0
+    return count
+
+
+def tridiagonal_eigenvalues(d, e, tol=None):
+    """Все собственные значения трёхдиагональной матрицы бисекцией по Штурму.
+
+    Все n интервалов делятся одновременно: за итерацию — один векторный проход sturm_count.
+    """
+    n = len(d)
+    radius = np.abs(np.concatenate([e, [0.0]])) + np.abs(np.concatenate([[0.0], e]))
+    lo_bound = float(np.min(d - radius))
+    hi_bound = float(np.max(d + radius))
+    norm = max(abs(lo_bound), abs(hi_bound), EPS)
+    if tol is None:
+        tol = 2.0 * EPS * norm
+    # Границы Гершгорина могут совпадать с собственным значением — расширяются на tol
+    lo_bound -= tol
+    hi_bound += tol
+    k = np.arange(n)
+    lo = np.full(n, lo_bound)
+    hi = np.full(n, hi_bound)
+    while np.max(hi - lo) > tol:
+        mid = 0.5 * (lo + hi)
+        below = sturm_count(d, e, mid) <= k
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return 0.5 * (lo + hi)
+
+
+def eigenvalue_clusters(w, gap):
+    """Индексы групп подряд идущих собственных значений с расстоянием меньше gap"""
+    breaks = np.flatnonzero(np.diff(w) > gap) + 1
+    return [c for c in np.split(np.arange(len(w)), breaks) if len(c) > 1]
+
+
+def tridiagonal_inverse_iteration(d, e, w, iterations=INVERSE_ITERATIONS, seed=0):
+    """Собственные векторы трёхдиагональной матрицы обратными итерациями — для всех w сразу.
+
+    (T - w_j I) y = x решается исключением Гаусса с частичным выбором по строкам, векторно
+    по всем j; разложение строится один раз и используется во всех итерациях.
+    Векторы кластеров близких собственных значений ортогонализуются QR-разложением.
+    """
+    n, m = len(d), len(w)
+    norm = max(np.abs(d).max() + 2.0 * np.abs(e).max(initial=0.0), EPS)
+    tiny = EPS * norm
+    sup = np.concatenate([e, [0.0]])
+
+    U0 = np.empty((n, m))
+    U1 = np.zeros((n, m))
+    U2 = np.zeros((n, m))
+    mult = np.zeros((n, m))
+    swap = np.zeros((n, m), dtype=bool)
+    c0 = d[0] - w
+    c1 = np.full(m, sup[0])
+    for i in range(n - 1):
+        sub = e[i]
+        dd = d[i + 1] - w
+        s = np.abs(sub) > np.abs(c0)
+        swap[i] = s
+        U0[i] = np.where(s, sub, c0)
+        U1[i] = np.where(s, dd, c1)
+        U2[i] = np.where(s, sup[i + 1], 0.0)
+        U0[i] = np.where(U0[i] == 0.0, tiny, U0[i])
+        mult[i] = np.where(s, c0, sub) / U0[i]
+        # Текущая строка i+1 после исключения: элементы в столбцах i+1 и i+2
+        c0, c1 = (
+            np.where(s, c1 - mult[i] * dd, dd - mult[i] * c1),
+            np.where(s, -mult[i] * sup[i + 1], sup[i + 1]),
+        )
+    U0[n - 1] = np.where(c0 == 0.0, tiny, c0)
+
+    groups = eigenvalue_clusters(w, CLUSTER_GAP * norm)
+    X = np.random.default_rng(seed).uniform(-1.0, 1.0, (n, m))
+    for _ in range(iterations):
+        Y = X
+        for i in range(n - 1):
+            top = np.where(swap[i], Y[i + 1], Y[i])
+            Y[i + 1] = np.where(swap[i], Y[i], Y[i + 1]) - mult[i] * top
+            Y[i] = top
+        Y[n - 1] /= U0[n - 1]
+        if n > 1:
+            Y[n - 2] = (Y[n - 2] - U1[n - 2] * Y[n - 1]) / U0[n - 2]
+        for i in range(n - 3, -1, -1):
+            Y[i] = (Y[i] - U1[i] * Y[i + 1] - U2[i] * Y[i + 2]) / U0[i]
+        for g in groups:
+            Y[:, g] = np.linalg.qr(Y[:, g])[0]
+        X = Y / np.linalg.norm(Y, axis=0)
+    return X
+
+
+def eigh(A, vectors=True):
+    """Собственные значения (по возрастанию) и, при vectors=True, собственные векторы
+    (по столбцам) симметричной матрицы за O(n^3)."""
+    d, e, reflectors = tridiagonalize(A)
+    if len(d) == 0:
+        return (np.empty(0), np.empty((0, 0))) if vectors else np.empty(0)
+    w = tridiagonal_eigenvalues(d, e)
+    if not vectors:
+        return w
+    return w, apply_reflectors(reflectors, tridiagonal_inverse_iteration(d, e, w))